@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from django.contrib.auth import get_user_model
 from django.db.models import Q, Count
 from django.utils import timezone
+from clubManagement.streaming import StreamingJSONResponse, serialize_queryset, get_chunk_size
 from .models import ChatChannel, ChatMessage, MessageReaction, UserChannelStatus
 from .serializers import (
     ChatChannelSerializer, ChatMessageSerializer, MessageReactionSerializer,
@@ -142,8 +143,7 @@ class ChatChannelViewSet(viewsets.ModelViewSet):
             )
         
         from .serializers import UserSerializer
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
+        return StreamingJSONResponse(serialize_queryset(users, UserSerializer))
 
 
 class ChatMessageViewSet(viewsets.ModelViewSet):
@@ -292,19 +292,21 @@ class ChatMessageViewSet(viewsets.ModelViewSet):
                 'channel_id': channel.id,
                 'participants': [p.username for p in channel.participants.all()],
                 'total_messages': messages.count(),
-                'messages': []
             }
             
-            for msg in messages:
-                debug_data['messages'].append({
-                    'id': msg.id,
-                    'content': msg.content,
-                    'sender': msg.sender.username,
-                    'created_at': msg.created_at.isoformat(),
-                    'is_deleted': msg.is_deleted
-                })
+            rows = messages.values_list('id', 'content', 'sender__username', 'created_at', 'is_deleted')
+            message_data = (
+                {
+                    'id': msg_id,
+                    'content': content,
+                    'sender': sender,
+                    'created_at': created_at.isoformat(),
+                    'is_deleted': is_deleted
+                }
+                for msg_id, content, sender, created_at, is_deleted in rows.iterator(chunk_size=get_chunk_size())
+            )
             
-            return Response(debug_data)
+            return StreamingJSONResponse(message_data, envelope=debug_data, key='messages')
         except ChatChannel.DoesNotExist:
             return Response({"error": "Channel not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -74,6 +74,21 @@ DATABASES = {
     }
 }
 
+# Shared by every web worker and the management commands, so a cache entry
+# invalidated by a command (recurrence, archive) or by another worker is gone
+# everywhere. The table is created by ``migrate``
+# (tasks/migrations/0009_cache_table.py).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'OPTIONS': {
+            # Report day counts add one entry per scope and day
+            'MAX_ENTRIES': 50000,
+        },
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -178,4 +193,64 @@ ROLE_CHOICES = [
     (ROLE_SENIOR_COUNCIL, 'Senior Council'),
     (ROLE_JUNIOR_COUNCIL, 'Junior Council'),
     (ROLE_BOARD_MEMBER, 'Board Member'),
-] 
\ No newline at end of file
+] 
+
+# Number of rows fetched per database round trip by streaming list endpoints
+STREAMING_CHUNK_SIZE = 500
+
+# Latest comments and history entries embedded in the task detail payload
+TASK_DETAIL_EMBED_LIMIT = 20
+
+# Maximum number of tasks a single bulk request may touch
+TASK_BULK_MAX_ITEMS = 1000
+
+# Task audit log: entries are queued and bulk-inserted by a background thread
+TASK_AUDIT_ASYNC = True
+TASK_AUDIT_QUEUE_SIZE = 10000
+TASK_AUDIT_FLUSH_INTERVAL = 1.0  # seconds
+TASK_AUDIT_BATCH_SIZE = 500
+
+# Task CSV import: rows validated and inserted per chunk, errors reported per row
+TASK_IMPORT_CHUNK_SIZE = 500
+TASK_IMPORT_MAX_ERRORS = 1000
+
+# How far ahead generate_recurring_tasks materializes recurring task occurrences
+TASK_RECURRENCE_LOOKAHEAD_DAYS = 30
+
+# Seconds a domain's assignee workload stays cached (task writes also invalidate it)
+TASK_WORKLOAD_CACHE_TIMEOUT = 300
+
+# Completed/cancelled tasks older than this many days are moved to the archive tables by archive_tasks
+TASK_ARCHIVE_AFTER_DAYS = 180
+
+# Seconds a note statistics entry stays cached per visibility scope (note writes also invalidate it)
+NOTE_STATISTICS_CACHE_TIMEOUT = 300
+
+# Characters of description/purpose returned by the note list in excerpt mode
+NOTE_EXCERPT_LENGTH = 280
+
+# Note revisions: full snapshot every N revisions, deltas in between, written by a background thread
+NOTE_REVISION_SNAPSHOT_INTERVAL = 10
+NOTE_REVISION_ASYNC = True
+NOTE_REVISION_QUEUE_SIZE = 10000
+NOTE_REVISION_FLUSH_INTERVAL = 1.0  # seconds
+NOTE_REVISION_BATCH_SIZE = 200
+
+# Note views are queued in memory per worker and flushed with one UPDATE per batch
+NOTE_VIEW_BUFFERED = True
+NOTE_VIEW_QUEUE_SIZE = 10000
+NOTE_VIEW_FLUSH_INTERVAL = 10  # seconds
+NOTE_VIEW_BATCH_SIZE = 500
+# Half-life of a view's contribution to a note's popularity score
+NOTE_POPULARITY_HALF_LIFE_DAYS = 7
+
+# Seconds a finished day's report counts stay cached; past days are otherwise never recomputed
+REPORT_DAILY_CACHE_TIMEOUT = 60 * 60 * 24 * 120
+
+# Rows must have been visible this long before the daily rollup consumes them,
+# so transactions that commit out of id order are not skipped
+REPORT_ROLLUP_SETTLE_SECONDS = 300
+
+# Batched activity tracking: events per request, and how old a client timestamp may be
+ACTIVITY_BATCH_MAX_EVENTS = 500
+ACTIVITY_BATCH_MAX_AGE_DAYS = 7
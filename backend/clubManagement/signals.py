@@ -0,0 +1,15 @@
+"""
+Helpers for signal receivers shared across apps.
+"""
+from django.db.models import QuerySet
+
+
+def deleting_parent(origin, model):
+    """
+    Whether a post_delete was sent while deleting ``model`` rows, as when
+    comments are cascaded from their task. Receivers that update the parent
+    can skip the work, since the parent is about to be gone.
+    """
+    if isinstance(origin, QuerySet):
+        return origin.model is model
+    return isinstance(origin, model)
@@ -0,0 +1,127 @@
+"""
+Streaming JSON, CSV and NDJSON helpers for large list endpoints.
+"""
+import csv
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def get_chunk_size():
+    return getattr(settings, 'STREAMING_CHUNK_SIZE', 500)
+
+
+def serialize_queryset(queryset, serializer_class, chunk_size=None, **kwargs):
+    """Yield serialized rows, fetching the queryset in chunks"""
+    chunk_size = chunk_size or get_chunk_size()
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        yield serializer_class(obj, **kwargs).data
+
+
+def iter_json_array(rows, chunk_size=None):
+    """Encode an iterable of rows as a JSON array, one buffered chunk at a time"""
+    chunk_size = chunk_size or get_chunk_size()
+    encoder = JSONEncoder()
+    buffer = ['[']
+    first = True
+
+    for row in rows:
+        if not first:
+            buffer.append(',')
+        buffer.append(encoder.encode(row))
+        first = False
+        if len(buffer) >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+
+    buffer.append(']')
+    yield ''.join(buffer).encode('utf-8')
+
+
+def iter_json_object(envelope, key, rows, chunk_size=None):
+    """Encode ``envelope`` as a JSON object whose ``key`` holds the streamed rows"""
+    encoder = JSONEncoder()
+    head = encoder.encode(envelope)[:-1]
+    separator = ',' if envelope else ''
+    yield f'{head}{separator}{json.dumps(key)}:'.encode('utf-8')
+    yield from iter_json_array(rows, chunk_size)
+    yield b'}'
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Stream a JSON array (or an object wrapping one) without building the
+    whole payload in memory.
+    """
+    def __init__(self, rows, envelope=None, key='results', chunk_size=None, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        if envelope is None:
+            content = iter_json_array(rows, chunk_size)
+        else:
+            content = iter_json_object(envelope, key, rows, chunk_size)
+        super().__init__(content, **kwargs)
+
+
+def csv_value(value):
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+class Echo:
+    """File-like object that hands back whatever is written to it"""
+    def write(self, value):
+        return value
+
+
+def iter_csv(header, rows, chunk_size=None):
+    """Encode a header and rows of values as CSV, one buffered chunk at a time"""
+    chunk_size = chunk_size or get_chunk_size()
+    writer = csv.writer(Echo())
+    buffer = [writer.writerow(header)]
+
+    for row in rows:
+        buffer.append(writer.writerow([csv_value(value) for value in row]))
+        if len(buffer) >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def iter_ndjson(rows, chunk_size=None):
+    """Encode rows as newline-delimited JSON, one buffered chunk at a time"""
+    chunk_size = chunk_size or get_chunk_size()
+    encoder = JSONEncoder()
+    buffer = []
+
+    for row in rows:
+        buffer.append(encoder.encode(row) + '\n')
+        if len(buffer) >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Lets ``?format=csv`` through DRF content negotiation; the body itself is
+    streamed by the view.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return JSONEncoder().encode(data).encode('utf-8')
+
+
+class NDJSONRenderer(CSVRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
@@ -0,0 +1,149 @@
+"""
+Write-behind queue for records that do not need to be written inside the
+request.
+
+Entries are queued in memory once the surrounding transaction commits, and a
+background thread writes them in batches, so recording costs the request little
+more than a queue put. When the queue is full the entries are written
+synchronously instead, and whatever is still queued is flushed when the process
+exits. Subclasses implement ``write``. With a ``write_interval`` the thread
+pauses that long after each write, so entries accumulate into larger batches.
+
+Each batch is written in one transaction. Transient database errors such as
+SQLite's "database is locked" are retried; if the batch still fails, its
+entries are written one at a time so a single bad row (say, one whose task was
+deleted in the meantime) only loses itself.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.db import OperationalError, close_old_connections, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindQueue:
+    thread_name = 'write-behind'
+    retries = 3
+    retry_delay = 0.2  # seconds, doubled after every attempt
+
+    def __init__(self, maxsize, flush_interval, batch_size, write_interval=0):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.write_interval = write_interval
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def is_async(self):
+        """Whether entries go through the background thread; override to read a setting"""
+        return True
+
+    def write(self, entries):
+        raise NotImplementedError
+
+    def describe(self, entry):
+        """Short description of an entry for the error log"""
+        return repr(entry)
+
+    def record(self, entries):
+        """Queue entries once the surrounding transaction commits"""
+        if entries:
+            transaction.on_commit(lambda: self._enqueue(entries))
+
+    def _enqueue(self, entries):
+        if not self.is_async() or self._stopped.is_set():
+            self._write(entries)
+            return
+
+        self._ensure_started()
+        for index, entry in enumerate(entries):
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                logger.warning('%s queue is full, writing %d entries synchronously', self.thread_name, len(entries) - index)
+                self._write(entries[index:])
+                return
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                if self._thread is None:
+                    atexit.register(self.shutdown)
+                self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                batch = self._drain(timeout=self.flush_interval)
+                if batch:
+                    close_old_connections()
+                    self._write(batch)
+                    if self.write_interval:
+                        self._stopped.wait(self.write_interval)
+        finally:
+            connection.close()
+
+    def _drain(self, timeout=None):
+        """Take up to ``batch_size`` entries, waiting at most ``timeout`` for the first"""
+        try:
+            batch = [self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait()]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _attempt(self, entries):
+        """Write ``entries`` atomically, retrying transient errors"""
+        delay = self.retry_delay
+        for attempt in range(self.retries + 1):
+            try:
+                with transaction.atomic():
+                    self.write(entries)
+                return
+            except OperationalError:
+                if attempt == self.retries:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+
+    def _write(self, entries):
+        try:
+            self._attempt(entries)
+            return
+        except Exception:
+            if len(entries) == 1:
+                logger.exception('%s failed to write entry %s', self.thread_name, self.describe(entries[0]))
+                return
+            logger.warning('%s failed to write a batch of %d entries, retrying one by one', self.thread_name, len(entries))
+
+        for entry in entries:
+            try:
+                self._attempt([entry])
+            except Exception:
+                logger.exception('%s failed to write entry %s', self.thread_name, self.describe(entry))
+
+    def flush(self):
+        """Write everything currently queued from the calling thread"""
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            self._write(batch)
+
+    def shutdown(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval * 2)
+        self.flush()
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def ensure_search_index(sender, using, **kwargs):
+    from django.db import connections
+    from .search import install_search_index
+    
+    connection = connections[using]
+    if 'notes' in connection.introspection.table_names():
+        install_search_index(connection)
 
 
 class NotesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'notes' 
\ No newline at end of file
+    name = 'notes'
+    
+    def ready(self):
+        post_migrate.connect(ensure_search_index, sender=self)
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:14
+
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_counts(apps, schema_editor):
+    Note = apps.get_model('notes', 'Note')
+    NoteComment = apps.get_model('notes', 'NoteComment')
+    comments = NoteComment.objects.filter(note=OuterRef('pk')).order_by().values('note')
+    Note.objects.update(
+        comment_count=Coalesce(Subquery(comments.annotate(total=Count('pk')).values('total')), 0),
+        last_comment_at=Subquery(comments.annotate(latest=Max('created_at')).values('latest'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0003_alter_note_domain'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='last_comment_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_comment_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_tag_index(apps, schema_editor):
+    Note = apps.get_model('notes', 'Note')
+    Tag = apps.get_model('notes', 'Tag')
+    NoteTag = apps.get_model('notes', 'NoteTag')
+    
+    names_by_note = {}
+    for note_id, tags in Note.objects.exclude(tags='').values_list('id', 'tags').iterator():
+        names = [tag.strip().lower()[:100] for tag in (tags or '').split(',') if tag.strip()]
+        names_by_note[note_id] = list(dict.fromkeys(names))
+    
+    names = {name for note_names in names_by_note.values() for name in note_names}
+    Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.values_list('name', 'id'))
+    NoteTag.objects.bulk_create([
+        NoteTag(note_id=note_id, tag_id=tag_ids[name])
+        for note_id, note_names in names_by_note.items()
+        for name in note_names
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0004_comment_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'db_table': 'note_tags_index',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='NoteTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('note', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='note_tags', to='notes.note')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='note_tags', to='notes.tag')),
+            ],
+            options={
+                'db_table': 'note_tag_links',
+            },
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='tag_index',
+            field=models.ManyToManyField(blank=True, related_name='notes', through='notes.NoteTag', to='notes.tag'),
+        ),
+        migrations.AddIndex(
+            model_name='notetag',
+            index=models.Index(fields=['tag', 'note'], name='notes_tag_note_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='notetag',
+            constraint=models.UniqueConstraint(fields=('note', 'tag'), name='notes_unique_note_tag'),
+        ),
+        migrations.RunPython(backfill_tag_index, migrations.RunPython.noop),
+    ]
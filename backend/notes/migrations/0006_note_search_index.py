@@ -0,0 +1,65 @@
+from django.db import migrations
+
+# The index DDL is inlined so later changes to notes.search cannot alter this
+# migration; notes.apps reinstalls the current definition after every migrate.
+CREATE_INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+        title, description, purpose,
+        content='notes', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO notes_fts(rowid, title, description, purpose)
+        VALUES (new.id, new.title, new.description, new.purpose);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN
+        INSERT INTO notes_fts(notes_fts, rowid, title, description, purpose)
+        VALUES ('delete', old.id, old.title, old.description, old.purpose);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE OF title, description, purpose ON notes BEGIN
+        INSERT INTO notes_fts(notes_fts, rowid, title, description, purpose)
+        VALUES ('delete', old.id, old.title, old.description, old.purpose);
+        INSERT INTO notes_fts(rowid, title, description, purpose)
+        VALUES (new.id, new.title, new.description, new.purpose);
+    END
+    """,
+    "INSERT INTO notes_fts(notes_fts) VALUES ('rebuild')",
+]
+
+DROP_INDEX_SQL = [
+    'DROP TRIGGER IF EXISTS notes_fts_ai',
+    'DROP TRIGGER IF EXISTS notes_fts_ad',
+    'DROP TRIGGER IF EXISTS notes_fts_au',
+    'DROP TABLE IF EXISTS notes_fts',
+]
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in CREATE_INDEX_SQL:
+        schema_editor.execute(statement)
+
+
+def remove_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in DROP_INDEX_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0005_tag_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, remove_search_index),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:23
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def snapshot_existing_notes(apps, schema_editor):
+    """Start every existing note's history with a snapshot of its current state"""
+    Note = apps.get_model('notes', 'Note')
+    NoteRevision = apps.get_model('notes', 'NoteRevision')
+    fields = ['title', 'description', 'purpose', 'tags', 'priority', 'domain', 'is_public']
+    NoteRevision.objects.bulk_create((
+        NoteRevision(
+            note_id=note['id'],
+            number=1,
+            author_id=note['author_id'],
+            is_snapshot=True,
+            data={field: note[field] for field in fields},
+            created_at=note['updated_at'],
+        )
+        for note in Note.objects.values('id', 'author_id', 'updated_at', *fields).iterator()
+    ), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notes', '0006_note_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NoteRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('is_snapshot', models.BooleanField(default=False)),
+                ('data', models.JSONField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='note_revisions', to=settings.AUTH_USER_MODEL)),
+                ('note', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='notes.note')),
+            ],
+            options={
+                'db_table': 'note_revisions',
+                'ordering': ['-number'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='noterevision',
+            constraint=models.UniqueConstraint(fields=('note', 'number'), name='notes_unique_revision_number'),
+        ),
+        migrations.RunPython(snapshot_existing_notes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0007_note_revisions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='popularity',
+            field=models.FloatField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='view_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:39
+
+import math
+
+from django.db import migrations, models
+
+
+def to_log_scores(apps, schema_editor):
+    """Popularity was a plain sum of view weights; store its base-2 logarithm"""
+    Note = apps.get_model('notes', 'Note')
+    notes = list(Note.objects.filter(popularity__gt=0).only('pk', 'popularity'))
+    for note in notes:
+        note.popularity = math.log2(note.popularity)
+    Note.objects.bulk_update(notes, ['popularity'], batch_size=500)
+    Note.objects.filter(popularity__lte=0).update(popularity=None)
+
+
+def from_log_scores(apps, schema_editor):
+    Note = apps.get_model('notes', 'Note')
+    notes = list(Note.objects.filter(popularity__isnull=False).only('pk', 'popularity'))
+    for note in notes:
+        # The old linear scale overflows past 1024 half-lives
+        note.popularity = 2.0 ** min(note.popularity, 1023)
+    Note.objects.bulk_update(notes, ['popularity'], batch_size=500)
+    Note.objects.filter(popularity__isnull=True).update(popularity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0008_note_popularity'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='note',
+            name='popularity',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(to_log_scores, from_log_scores),
+    ]
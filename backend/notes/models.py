@@ -1,9 +1,26 @@
 from django.db import models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from clubManagement.signals import deleting_parent
 
 User = get_user_model()
 
 
+def split_tags(value):
+    """Tags as typed in the comma-separated ``Note.tags`` field, without blanks"""
+    return [tag.strip() for tag in (value or '').split(',') if tag.strip()]
+
+
+def normalize_tags(value):
+    """Distinct lower-cased tag names, as stored in the tag index"""
+    max_length = Tag._meta.get_field('name').max_length
+    return list(dict.fromkeys(tag.lower()[:max_length] for tag in split_tags(value)))
+
+
 class Note(models.Model):
     PRIORITY_CHOICES = [
         ('low', 'Low'),
@@ -32,10 +49,22 @@ class Note(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Denormalized comment activity, maintained by the NoteComment signals below
+    comment_count = models.PositiveIntegerField(default=0)
+    last_comment_at = models.DateTimeField(null=True, blank=True)
+    
+    # Read counters, flushed in batches by notes.popularity; popularity is a
+    # log-scale score and stays empty until the note is first viewed
+    view_count = models.PositiveIntegerField(default=0)
+    popularity = models.FloatField(null=True, blank=True, db_index=True)
+    
     # Additional fields
     attachments = models.FileField(upload_to='note_attachments/', blank=True, null=True)
     tags = models.CharField(max_length=500, blank=True)  # Comma-separated tags
     
+    # Normalized index over ``tags``, kept in sync by the post_save signal below
+    tag_index = models.ManyToManyField('Tag', through='NoteTag', related_name='notes', blank=True)
+    
     class Meta:
         db_table = 'notes'
         ordering = ['-created_at']
@@ -46,9 +75,33 @@ class Note(models.Model):
     @property
     def tag_list(self):
         """Return tags as a list"""
-        if self.tags:
-            return [tag.strip() for tag in self.tags.split(',')]
-        return []
+        return split_tags(self.tags)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    
+    class Meta:
+        db_table = 'note_tags_index'
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+
+
+class NoteTag(models.Model):
+    note = models.ForeignKey(Note, on_delete=models.CASCADE, related_name='note_tags')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='note_tags')
+    
+    class Meta:
+        db_table = 'note_tag_links'
+        constraints = [
+            models.UniqueConstraint(fields=['note', 'tag'], name='notes_unique_note_tag'),
+        ]
+        indexes = [
+            # Tag -> notes lookups for filters and facet counts
+            models.Index(fields=['tag', 'note'], name='notes_tag_note_idx'),
+        ]
 
 
 class NoteComment(models.Model):
@@ -63,4 +116,83 @@ class NoteComment(models.Model):
         ordering = ['created_at']
     
     def __str__(self):
-        return f"Comment by {self.author.username} on {self.note.title}" 
\ No newline at end of file
+        return f"Comment by {self.author.username} on {self.note.title}"
+
+
+class NoteRevision(models.Model):
+    """
+    One saved version of a note. Every NOTE_REVISION_SNAPSHOT_INTERVAL-th
+    revision stores the full tracked state; the ones in between store only
+    the changes from the previous revision (see notes.revisions).
+    """
+    note = models.ForeignKey(Note, on_delete=models.CASCADE, related_name='revisions')
+    number = models.PositiveIntegerField()
+    author = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='note_revisions', null=True, blank=True)
+    is_snapshot = models.BooleanField(default=False)
+    data = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        db_table = 'note_revisions'
+        ordering = ['-number']
+        constraints = [
+            models.UniqueConstraint(fields=['note', 'number'], name='notes_unique_revision_number'),
+        ]
+    
+    def __str__(self):
+        return f"Revision {self.number} of {self.note_id}"
+
+
+def sync_note_tags(notes):
+    """Rebuild the tag index rows of the given notes from their ``tags`` strings"""
+    names_by_note = {note.pk: normalize_tags(note.tags) for note in notes}
+    names = {name for note_names in names_by_note.values() for name in note_names}
+    
+    Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.filter(name__in=names).values_list('name', 'id'))
+    
+    NoteTag.objects.filter(note_id__in=names_by_note).delete()
+    NoteTag.objects.bulk_create([
+        NoteTag(note_id=note_id, tag_id=tag_ids[name])
+        for note_id, note_names in names_by_note.items()
+        for name in note_names
+    ])
+
+
+@receiver(post_save, sender=Note)
+def update_note_tag_index(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and 'tags' not in update_fields:
+        return
+    if created and not instance.tags:
+        return
+    sync_note_tags([instance])
+
+
+@receiver(post_save, sender=Note)
+@receiver(post_delete, sender=Note)
+def invalidate_note_caches(sender, **kwargs):
+    """Cached aggregates over notes go stale on every note write"""
+    from .statistics import invalidate_note_statistics
+    invalidate_note_statistics()
+
+
+@receiver(post_save, sender=NoteComment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    """Bump the note's comment counters in a single UPDATE"""
+    if created:
+        Note.objects.filter(pk=instance.note_id).update(
+            comment_count=F('comment_count') + 1,
+            last_comment_at=instance.created_at
+        )
+
+
+@receiver(post_delete, sender=NoteComment)
+def decrement_comment_count(sender, instance, origin=None, **kwargs):
+    """Drop the note's comment count and fall back to its newest remaining comment"""
+    if deleting_parent(origin, Note):
+        return
+    latest = NoteComment.objects.filter(note=OuterRef('pk')).order_by('-created_at').values('created_at')[:1]
+    Note.objects.filter(pk=instance.note_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1,
+        last_comment_at=Subquery(latest)
+    )
@@ -0,0 +1,103 @@
+"""
+Buffered note view counting and time-decayed popularity.
+
+Detail views only queue the note id. A write-behind thread per worker lets the
+views pile up for NOTE_VIEW_FLUSH_INTERVAL seconds, then adds them with one
+UPDATE per NOTE_VIEW_BATCH_SIZE notes, so reading a note never waits on a
+write.
+
+Popularity decays with a half-life of NOTE_POPULARITY_HALF_LIFE_DAYS. Instead of
+periodically decaying every row, a view at time ``t`` is worth
+``2 ** (t / half-life)``, so newer views weigh exponentially more, and the
+stored value is the base-2 logarithm of the sum of those weights. Ordering by
+it is the same as ordering by the decayed score, so the plain ``popularity``
+index serves the ranking, and the logarithm grows only linearly with time so
+it never overflows. A note with no views has no score. ``decayed_score``
+converts the stored value back to "views as of now".
+"""
+import math
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Case, F, FloatField, IntegerField, Value, When
+from django.db.models.functions import Greatest, Least, Log, Power
+from django.utils import timezone
+
+from clubManagement.writebehind import WriteBehindQueue
+
+from .models import Note
+
+POPULARITY_EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def view_exponent(now=None):
+    """log2 of the weight of one view at ``now``; grows by one every half-life"""
+    return ((now or timezone.now()) - POPULARITY_EPOCH).total_seconds() / (
+        settings.NOTE_POPULARITY_HALF_LIFE_DAYS * 86400
+    )
+
+
+def decayed_score(popularity, now=None):
+    if popularity is None:
+        return 0.0
+    return 2.0 ** (popularity - view_exponent(now))
+
+
+def log2_add(field, increment):
+    """
+    ``log2(2 ** field + 2 ** increment)`` as an expression, taking the larger
+    operand out so the power never exceeds 1; a missing score becomes ``increment``
+    """
+    high = Greatest(F(field), increment)
+    low = Least(F(field), increment)
+    return Case(
+        When(**{f'{field}__isnull': True}, then=increment),
+        default=high + Log(Value(2.0), Value(1.0) + Power(Value(2.0), low - high)),
+        output_field=FloatField()
+    )
+
+
+def apply_view_counts(counts, now=None):
+    """Add buffered view counts to their notes with one UPDATE"""
+    if not counts:
+        return
+    exponent = view_exponent(now)
+    Note.objects.filter(pk__in=counts).update(
+        view_count=F('view_count') + Case(
+            *[When(pk=note_id, then=Value(count)) for note_id, count in counts.items()],
+            output_field=IntegerField()
+        ),
+        popularity=log2_add('popularity', Case(
+            *[When(pk=note_id, then=Value(math.log2(count) + exponent)) for note_id, count in counts.items()],
+            output_field=FloatField()
+        )),
+    )
+
+
+class ViewCounter(WriteBehindQueue):
+    thread_name = 'note-view-counter'
+
+    def is_async(self):
+        return settings.NOTE_VIEW_BUFFERED
+
+    def record_view(self, note_id):
+        self.record([note_id])
+
+    def describe(self, entry):
+        return f'view of note {entry}'
+
+    def write(self, entries):
+        """Add the queued views, ``NOTE_VIEW_BATCH_SIZE`` notes per UPDATE"""
+        items = list(Counter(entries).items())
+        for start in range(0, len(items), settings.NOTE_VIEW_BATCH_SIZE):
+            apply_view_counts(dict(items[start:start + settings.NOTE_VIEW_BATCH_SIZE]))
+
+
+note_views = ViewCounter(
+    maxsize=settings.NOTE_VIEW_QUEUE_SIZE,
+    flush_interval=settings.NOTE_VIEW_FLUSH_INTERVAL,
+    # Each write takes everything queued since the last one
+    batch_size=settings.NOTE_VIEW_QUEUE_SIZE,
+    write_interval=settings.NOTE_VIEW_FLUSH_INTERVAL,
+)
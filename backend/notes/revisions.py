@@ -0,0 +1,230 @@
+"""
+Delta-compressed note revision history.
+
+Revision 1 of a note and every NOTE_REVISION_SNAPSHOT_INTERVAL-th revision
+after it store the full tracked state. The revisions in between store only
+what changed since the previous one: the new value of changed scalar fields,
+and a word-level patch for changed text fields. Rebuilding any revision reads
+its nearest snapshot plus fewer than NOTE_REVISION_SNAPSHOT_INTERVAL deltas in
+a single query.
+
+Revisions are computed and inserted by a write-behind queue after the note's
+transaction commits, never inside the request. Numbers are allocated under a
+row lock on the notes, and a batch that still collides with a concurrent
+writer on (note, number) is recomputed from the fresh latest revisions.
+"""
+import difflib
+import re
+from itertools import groupby
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Max, Q, Subquery
+from django.utils import timezone
+
+from clubManagement.writebehind import WriteBehindQueue
+
+from .models import Note, NoteRevision
+
+TEXT_FIELDS = ['title', 'description', 'purpose', 'tags']
+VALUE_FIELDS = ['priority', 'domain', 'is_public']
+TRACKED_FIELDS = TEXT_FIELDS + VALUE_FIELDS
+
+TOKEN_RE = re.compile(r'\s+|\S+\s*')
+
+
+def note_state(note):
+    return {field: getattr(note, field) for field in TRACKED_FIELDS}
+
+
+def make_patch(old, new):
+    """
+    Word-level patch turning ``old`` into ``new``: positive integers keep that
+    many tokens, negative integers skip them, and strings are inserted.
+    """
+    old_tokens = TOKEN_RE.findall(old or '')
+    new_tokens = TOKEN_RE.findall(new or '')
+    patch = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old_tokens, new_tokens).get_opcodes():
+        if tag == 'equal':
+            patch.append(i2 - i1)
+            continue
+        if i2 > i1:
+            patch.append(i1 - i2)
+        if j2 > j1:
+            patch.append(''.join(new_tokens[j1:j2]))
+    return patch
+
+
+def apply_patch(old, patch):
+    tokens = TOKEN_RE.findall(old or '')
+    position = 0
+    result = []
+    for op in patch:
+        if isinstance(op, str):
+            result.append(op)
+        elif op > 0:
+            result.extend(tokens[position:position + op])
+            position += op
+        else:
+            position -= op
+    return ''.join(result)
+
+
+def make_delta(old_state, new_state):
+    """Changes between two states, or None if nothing tracked changed"""
+    delta = {}
+    for field in TEXT_FIELDS:
+        if old_state.get(field) != new_state[field]:
+            delta.setdefault('patch', {})[field] = make_patch(old_state.get(field), new_state[field])
+    for field in VALUE_FIELDS:
+        if old_state.get(field) != new_state[field]:
+            delta.setdefault('set', {})[field] = new_state[field]
+    return delta or None
+
+
+def apply_delta(state, delta):
+    state = dict(state)
+    for field, patch in delta.get('patch', {}).items():
+        state[field] = apply_patch(state.get(field), patch)
+    state.update(delta.get('set', {}))
+    return state
+
+
+def replay(revisions):
+    """Fold a snapshot followed by its deltas, in number order, into a state"""
+    state = None
+    for revision in revisions:
+        state = dict(revision.data) if revision.is_snapshot else apply_delta(state, revision.data)
+    return state
+
+
+def chain_filter(note_id, number):
+    """Matches the nearest snapshot at or before ``number`` and the deltas after it"""
+    snapshot = NoteRevision.objects.filter(
+        note_id=note_id, number__lte=number, is_snapshot=True
+    ).order_by('-number').values('number')[:1]
+    return Q(note_id=note_id, number__lte=number, number__gte=Subquery(snapshot))
+
+
+def revision_chain(note_id, number):
+    return NoteRevision.objects.filter(chain_filter(note_id, number)).order_by('number')
+
+
+def reconstruct(note_id, number):
+    """Tracked state of a note as of revision ``number``, or None if it does not exist"""
+    revisions = list(revision_chain(note_id, number))
+    if not revisions or revisions[-1].number != number:
+        return None
+    return replay(revisions)
+
+
+def latest_states(note_ids):
+    """Latest revision number and state for each note, in two queries"""
+    latest = dict(
+        NoteRevision.objects.filter(note_id__in=note_ids).values('note_id').annotate(
+            latest=Max('number')
+        ).values_list('note_id', 'latest')
+    )
+    if not latest:
+        return {}
+
+    chains = Q()
+    for note_id, number in latest.items():
+        chains |= chain_filter(note_id, number)
+
+    revisions = NoteRevision.objects.filter(chains).order_by('note_id', 'number')
+    return {
+        note_id: (latest[note_id], replay(chain))
+        for note_id, chain in groupby(revisions, key=lambda revision: revision.note_id)
+    }
+
+
+def is_snapshot_number(number):
+    return (number - 1) % settings.NOTE_REVISION_SNAPSHOT_INTERVAL == 0
+
+
+class NoteRevisionWriter(WriteBehindQueue):
+    thread_name = 'note-revision-writer'
+    numbering_attempts = 3
+
+    def is_async(self):
+        return settings.NOTE_REVISION_ASYNC
+
+    def record_note(self, note, user):
+        """Queue a revision of ``note`` as it is now"""
+        self.record([{
+            'note_id': note.pk,
+            'author_id': getattr(user, 'pk', None),
+            'created_at': timezone.now(),
+            'state': note_state(note),
+        }])
+
+    def describe(self, entry):
+        return f"revision of note {entry['note_id']} at {entry['created_at'].isoformat()}"
+
+    def write(self, entries):
+        # Lock the notes so concurrent writers number their revisions one
+        # after the other; this also drops entries for notes deleted since
+        existing = set(
+            Note.objects.select_for_update().filter(
+                pk__in={entry['note_id'] for entry in entries}
+            ).values_list('pk', flat=True)
+        )
+        entries = [entry for entry in entries if entry['note_id'] in existing]
+        for attempt in range(self.numbering_attempts):
+            try:
+                with transaction.atomic():
+                    self._insert(entries)
+                return
+            except IntegrityError:
+                # Another writer took the same numbers (databases without row
+                # locks); renumber from the revisions now in the table
+                if attempt == self.numbering_attempts - 1:
+                    raise
+
+    def _insert(self, entries):
+        current = latest_states({entry['note_id'] for entry in entries})
+        revisions = []
+        for entry in entries:
+            number, state = current.get(entry['note_id'], (0, None))
+            number += 1
+            if is_snapshot_number(number) or state is None:
+                data, is_snapshot = entry['state'], True
+            else:
+                data, is_snapshot = make_delta(state, entry['state']), False
+                if data is None:
+                    # Saved without changing anything tracked
+                    continue
+            revisions.append(NoteRevision(
+                note_id=entry['note_id'],
+                number=number,
+                author_id=entry['author_id'],
+                is_snapshot=is_snapshot,
+                data=data,
+                created_at=entry['created_at'],
+            ))
+            current[entry['note_id']] = (number, entry['state'])
+        NoteRevision.objects.bulk_create(revisions, batch_size=self.batch_size)
+
+
+note_revisions = NoteRevisionWriter(
+    maxsize=settings.NOTE_REVISION_QUEUE_SIZE,
+    flush_interval=settings.NOTE_REVISION_FLUSH_INTERVAL,
+    batch_size=settings.NOTE_REVISION_BATCH_SIZE,
+)
+
+
+def diff_states(old_state, new_state):
+    """Per-field changes between two states: unified diff lines for text, old/new for values"""
+    changes = {}
+    for field in TEXT_FIELDS:
+        old, new = old_state.get(field) or '', new_state.get(field) or ''
+        if old != new:
+            changes[field] = list(difflib.unified_diff(
+                old.splitlines(), new.splitlines(), lineterm='', n=2
+            ))[2:]
+    for field in VALUE_FIELDS:
+        if old_state.get(field) != new_state.get(field):
+            changes[field] = {'old': old_state.get(field), 'new': new_state.get(field)}
+    return changes
@@ -0,0 +1,202 @@
+"""
+Ranked full-text search over note titles, descriptions and purposes.
+
+On SQLite the notes are indexed by an external-content FTS5 table kept in sync
+by triggers, so searches are ranked with BM25 and return highlighted snippets.
+Other databases fall back to unranked ``icontains`` matching.
+"""
+import html
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Note
+
+SEARCH_TABLE = 'notes_fts'
+
+# BM25 column weights: title, description, purpose
+RANK_WEIGHTS = (10.0, 1.0, 2.0)
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_END = '</mark>'
+SNIPPET_TOKENS = 24
+
+# FTS5 wraps matches in these private-use characters; the note text is escaped
+# before they are swapped for the real markup, so only our tags reach clients
+MATCH_START = '\ue000'
+MATCH_END = '\ue001'
+
+CREATE_INDEX_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        title, description, purpose,
+        content='notes', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, description, purpose)
+        VALUES (new.id, new.title, new.description, new.purpose);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON notes BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description, purpose)
+        VALUES ('delete', old.id, old.title, old.description, old.purpose);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au AFTER UPDATE OF title, description, purpose ON notes BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description, purpose)
+        VALUES ('delete', old.id, old.title, old.description, old.purpose);
+        INSERT INTO {SEARCH_TABLE}(rowid, title, description, purpose)
+        VALUES (new.id, new.title, new.description, new.purpose);
+    END
+    """,
+]
+
+DROP_INDEX_SQL = [
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ai',
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ad',
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_au',
+    f'DROP TABLE IF EXISTS {SEARCH_TABLE}',
+]
+
+
+def search_supported(using_connection=None):
+    return (using_connection or connection).vendor == 'sqlite'
+
+
+def install_search_index(using_connection, rebuild=False):
+    """
+    Create the FTS table and its triggers if missing. SQLite table rebuilds
+    during migrations drop the triggers on ``notes``, so this also runs after
+    every migrate.
+    """
+    if not search_supported(using_connection):
+        return
+    with using_connection.cursor() as cursor:
+        for statement in CREATE_INDEX_SQL:
+            cursor.execute(statement)
+        if rebuild:
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+
+
+def drop_search_index(using_connection):
+    if not search_supported(using_connection):
+        return
+    with using_connection.cursor() as cursor:
+        for statement in DROP_INDEX_SQL:
+            cursor.execute(statement)
+
+
+def build_match_query(text):
+    """
+    Turn free text into an FTS5 query: every word must match, and the last
+    word also matches as a prefix so results update while typing.
+    """
+    words = re.findall(r'\w+', text or '')
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def render_highlight(text):
+    """HTML-escape FTS5 output and turn its match delimiters into <mark> tags"""
+    if text is None:
+        return None
+    return html.escape(text).replace(MATCH_START, HIGHLIGHT_START).replace(MATCH_END, HIGHLIGHT_END)
+
+
+def filter_notes(queryset, text):
+    """Restrict a note queryset to notes matching ``text``, without ranking"""
+    if not search_supported():
+        return queryset.filter(
+            Q(title__icontains=text) | Q(description__icontains=text) | Q(purpose__icontains=text)
+        )
+    match = build_match_query(text)
+    if match is None:
+        return queryset
+    return queryset.filter(
+        pk__in=RawSQL(f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s', [match])
+    )
+
+
+class NoteSearchResults:
+    """
+    Lazily evaluated, best-match-first search results over ``queryset``
+    (usually the caller's visible notes). Supports ``count()`` and slicing so
+    it can be handed to the standard paginators; each slice runs one ranked
+    query for its ids and one query for the notes themselves.
+    """
+
+    def __init__(self, queryset, text):
+        self.queryset = queryset
+        self.text = text
+        self.match = build_match_query(text) if search_supported() else None
+
+    def _scope_sql(self):
+        return self.queryset.order_by().values('pk').query.sql_with_params()
+
+    def count(self):
+        if not search_supported():
+            return filter_notes(self.queryset, self.text).count()
+        if self.match is None:
+            return 0
+        scope_sql, scope_params = self._scope_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT COUNT(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND rowid IN ({scope_sql})',
+                [self.match, *scope_params]
+            )
+            return cursor.fetchone()[0]
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        if not search_supported():
+            notes = filter_notes(self.queryset, self.text).select_related('author')[index]
+            for note in notes:
+                note.search_rank = note.title_highlight = note.snippet = None
+            return list(notes)
+        if self.match is None:
+            return []
+
+        offset = index.start or 0
+        limit = -1 if index.stop is None else max(index.stop - offset, 0)
+        scope_sql, scope_params = self._scope_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid, bm25({SEARCH_TABLE}, %s, %s, %s), '
+                f'highlight({SEARCH_TABLE}, 0, %s, %s), '
+                f'snippet({SEARCH_TABLE}, -1, %s, %s, %s, %s) '
+                f'FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND rowid IN ({scope_sql}) '
+                f'ORDER BY 2, rowid LIMIT %s OFFSET %s',
+                [
+                    *RANK_WEIGHTS,
+                    MATCH_START, MATCH_END,
+                    MATCH_START, MATCH_END, '…', SNIPPET_TOKENS,
+                    self.match, *scope_params, limit, offset
+                ]
+            )
+            hits = cursor.fetchall()
+
+        notes = Note.objects.select_related('author').in_bulk([hit[0] for hit in hits])
+        results = []
+        for note_id, rank, title_highlight, snippet in hits:
+            note = notes.get(note_id)
+            if note is None:
+                continue
+            # bm25() is lower for better matches; expose it as higher-is-better
+            note.search_rank = -rank
+            note.title_highlight = render_highlight(title_highlight)
+            note.snippet = render_highlight(snippet)
+            results.append(note)
+        return results
@@ -1,6 +1,8 @@
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from .models import Note, NoteComment
+from .models import Note, NoteComment, NoteRevision
+from .revisions import note_revisions
 
 User = get_user_model()
 
@@ -30,9 +32,9 @@ class NoteSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'purpose', 'priority', 'author',
             'domain', 'is_public', 'created_at', 'updated_at', 'attachments',
-            'tags', 'tag_list', 'comments'
+            'tags', 'tag_list', 'comment_count', 'last_comment_at', 'view_count', 'comments'
         ]
-        read_only_fields = ['author', 'created_at', 'updated_at']
+        read_only_fields = ['author', 'created_at', 'updated_at', 'comment_count', 'last_comment_at', 'view_count']
 
 
 class NoteCreateSerializer(serializers.ModelSerializer):
@@ -45,7 +47,9 @@ class NoteCreateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         validated_data['author'] = self.context['request'].user
-        return super().create(validated_data)
+        note = super().create(validated_data)
+        note_revisions.record_note(note, note.author)
+        return note
 
 
 class NoteUpdateSerializer(serializers.ModelSerializer):
@@ -55,6 +59,24 @@ class NoteUpdateSerializer(serializers.ModelSerializer):
             'title', 'description', 'purpose', 'priority', 'domain', 
             'is_public', 'attachments', 'tags'
         ]
+    
+    def update(self, instance, validated_data):
+        # Only the submitted fields, leaving the comment and view counters to
+        # their own F() updates
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        note = instance
+        note_revisions.record_note(note, self.context['request'].user)
+        return note
+
+
+class NoteRevisionSerializer(serializers.ModelSerializer):
+    author = UserSerializer(read_only=True)
+    
+    class Meta:
+        model = NoteRevision
+        fields = ['number', 'author', 'is_snapshot', 'created_at']
 
 
 class NoteListSerializer(serializers.ModelSerializer):
@@ -65,15 +87,57 @@ class NoteListSerializer(serializers.ModelSerializer):
         model = Note
         fields = [
             'id', 'title', 'description', 'purpose', 'priority', 'author',
-            'domain', 'is_public', 'created_at', 'tag_list'
+            'domain', 'is_public', 'created_at', 'tag_list', 'comment_count',
+            'last_comment_at'
         ]
         read_only_fields = ['author', 'created_at']
 
 
+def excerpt(text, length):
+    if len(text) <= length:
+        return text
+    return text[:length].rstrip() + '…'
+
+
+class NoteExcerptSerializer(NoteListSerializer):
+    """
+    List representation with ``description`` and ``purpose`` cut down to
+    NOTE_EXCERPT_LENGTH characters; the detail view returns the full text.
+    Expects the ``*_excerpt`` annotations added by the note list.
+    """
+    description = serializers.SerializerMethodField()
+    purpose = serializers.SerializerMethodField()
+    truncated = serializers.SerializerMethodField()
+    
+    class Meta(NoteListSerializer.Meta):
+        fields = NoteListSerializer.Meta.fields + ['truncated']
+    
+    def get_description(self, obj):
+        return excerpt(obj.description_excerpt, settings.NOTE_EXCERPT_LENGTH)
+    
+    def get_purpose(self, obj):
+        return excerpt(obj.purpose_excerpt, settings.NOTE_EXCERPT_LENGTH)
+    
+    def get_truncated(self, obj):
+        length = settings.NOTE_EXCERPT_LENGTH
+        return len(obj.description_excerpt) > length or len(obj.purpose_excerpt) > length
+
+
+class NoteSearchResultSerializer(NoteListSerializer):
+    rank = serializers.FloatField(source='search_rank', read_only=True)
+    title_highlight = serializers.CharField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+    
+    class Meta(NoteListSerializer.Meta):
+        fields = NoteListSerializer.Meta.fields + ['rank', 'title_highlight', 'snippet']
+
+
 class NoteFilterSerializer(serializers.Serializer):
     priority = serializers.ChoiceField(choices=Note.PRIORITY_CHOICES, required=False)
     domain = serializers.ChoiceField(choices=User.DOMAIN_CHOICES, required=False)
     author = serializers.IntegerField(required=False)
-    is_public = serializers.BooleanField(required=False)
+    is_public = serializers.BooleanField(required=False, allow_null=True, default=None)
     search = serializers.CharField(required=False)
-    tags = serializers.CharField(required=False) 
\ No newline at end of file
+    tags = serializers.CharField(required=False)
+    tag_prefix = serializers.CharField(required=False)
+    excerpt = serializers.BooleanField(required=False, default=False) 
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Dashboard note statistics, computed with two grouped queries and cached per
+visibility scope until the next note write.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+STATISTICS_VERSION_KEY = 'notes:statistics:version'
+
+
+def statistics_scope(user):
+    """Users who see the same notes share a cache entry"""
+    if user.is_admin or user.is_senior_council:
+        return 'all'
+    # Every other scope includes the user's own notes
+    return f'user:{user.pk}'
+
+
+def statistics_cache_key(user):
+    # Bumping the version orphans every scope's entry at once
+    version = cache.get_or_set(STATISTICS_VERSION_KEY, 1, None)
+    return f'notes:statistics:{version}:{statistics_scope(user)}'
+
+
+def invalidate_note_statistics():
+    """Drop every cached statistics entry; called after any note write"""
+    try:
+        cache.incr(STATISTICS_VERSION_KEY)
+    except ValueError:
+        cache.set(STATISTICS_VERSION_KEY, 1, None)
+
+
+def compute_note_statistics(notes):
+    notes = notes.order_by()
+    stats = notes.aggregate(
+        total_notes=Count('pk'),
+        high_priority_notes=Count('pk', filter=Q(priority='high')),
+        urgent_notes=Count('pk', filter=Q(priority='urgent')),
+        public_notes=Count('pk', filter=Q(is_public=True)),
+        private_notes=Count('pk', filter=Q(is_public=False)),
+    )
+    stats['domain_stats'] = dict(
+        notes.exclude(domain__isnull=True).exclude(domain='').values('domain').annotate(
+            count=Count('pk')
+        ).values_list('domain', 'count')
+    )
+    return stats
+
+
+def get_note_statistics(user, notes):
+    """Statistics over ``notes``, which must be ``user``'s visible notes"""
+    key = statistics_cache_key(user)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_note_statistics(notes)
+        cache.set(key, stats, settings.NOTE_STATISTICS_CACHE_TIMEOUT)
+    return stats
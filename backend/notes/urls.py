@@ -1,19 +1,28 @@
 from django.urls import path
 from .views import (
-    NoteListView, NoteDetailView, NoteCommentView, NoteCommentDetailView,
-    note_statistics, my_notes
+    NoteListView, NoteTagFacetView, NoteSearchView, NoteDetailView, NoteCommentView, NoteCommentDetailView,
+    NoteRevisionListView, note_revision, note_revision_diff, note_statistics, my_notes,
+    popular_notes
 )
 
 urlpatterns = [
     # Note management
     path('', NoteListView.as_view(), name='note_list'),
     path('<int:pk>/', NoteDetailView.as_view(), name='note_detail'),
+    path('tags/', NoteTagFacetView.as_view(), name='note_tag_facets'),
+    path('search/', NoteSearchView.as_view(), name='note_search'),
     
     # Note comments
     path('<int:note_id>/comments/', NoteCommentView.as_view(), name='note_comments'),
     path('comments/<int:pk>/', NoteCommentDetailView.as_view(), name='note_comment_detail'),
     
+    # Note revisions
+    path('<int:note_id>/revisions/', NoteRevisionListView.as_view(), name='note_revisions'),
+    path('<int:note_id>/revisions/diff/', note_revision_diff, name='note_revision_diff'),
+    path('<int:note_id>/revisions/<int:number>/', note_revision, name='note_revision'),
+    
     # Note statistics and filters
     path('statistics/', note_statistics, name='note_statistics'),
     path('my-notes/', my_notes, name='my_notes'),
+    path('popular/', popular_notes, name='popular_notes'),
 ] 
\ No newline at end of file
@@ -2,63 +2,85 @@ from rest_framework import generics, status, filters
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.db.models import Q
-from .models import Note, NoteComment
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from django.conf import settings
+from django.utils import timezone
+from django.db.models import Q, Count, Exists, OuterRef
+from django.db.models.functions import Substr
+from clubManagement.streaming import StreamingJSONResponse, serialize_queryset
+from .models import Note, NoteComment, NoteRevision, NoteTag, normalize_tags
+from .revisions import diff_states, reconstruct
+from .popularity import decayed_score, note_views
+from .search import NoteSearchResults, filter_notes
+from .statistics import get_note_statistics
 from .serializers import (
     NoteSerializer, NoteCreateSerializer, NoteUpdateSerializer, NoteListSerializer,
-    NoteCommentSerializer, NoteFilterSerializer
+    NoteCommentSerializer, NoteFilterSerializer, NoteSearchResultSerializer, NoteExcerptSerializer,
+    NoteRevisionSerializer
 )
 from users.permissions import CanManageNotes
 
 
+def get_visible_notes(user, queryset=None):
+    """Restrict a note queryset to what the given user is allowed to see"""
+    if queryset is None:
+        queryset = Note.objects.all()
+    
+    if user.is_admin or user.is_senior_council:
+        return queryset
+    elif user.is_junior_council:
+        # Junior council can see notes in their domain, public notes, or notes they created
+        if user.domain:
+            return queryset.filter(
+                Q(domain=user.domain) | Q(is_public=True) | Q(author=user)
+            )
+        return queryset.filter(
+            Q(is_public=True) | Q(author=user)
+        )
+    else:
+        # Board members can see public notes or notes they created
+        return queryset.filter(
+            Q(is_public=True) | Q(author=user)
+        )
+
+
+class NoteCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
+
+    def get_ordering(self, request, queryset, view):
+        # ``?ordering=priority`` is far from unique; a trailing id keeps rows
+        # with equal keys in a fixed order so cursors never skip or repeat them
+        ordering = super().get_ordering(request, queryset, view)
+        if not {'id', '-id', 'pk', '-pk'} & set(ordering):
+            ordering += ('-id',)
+        return ordering
+
+
 class NoteListView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['title', 'description', 'purpose']
+    # Text search goes through the full-text index via the ``search`` filter below
+    filter_backends = [filters.OrderingFilter]
     ordering_fields = ['created_at', 'priority']
     ordering = ['-created_at']
-    pagination_class = None  # Disable pagination
+    pagination_class = NoteCursorPagination
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return NoteCreateSerializer
+        if self.excerpt_mode():
+            return NoteExcerptSerializer
         return NoteListSerializer
     
+    def excerpt_mode(self):
+        filters = NoteFilterSerializer(data=self.request.query_params)
+        return filters.is_valid() and filters.validated_data.get('excerpt')
+    
     def get_queryset(self):
-        user = self.request.user
-        queryset = Note.objects.all()
-        
         # Apply role-based filtering
-        if user.is_admin:
-            # Admin can see all notes
-            pass
-        elif user.is_senior_council:
-            # Senior council can see all notes
-            pass
-        elif user.is_junior_council:
-            # Junior council can see notes in their domain, public notes, or notes they created
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(domain=user.domain) | Q(is_public=True) | Q(author=user)
-                )
-            else:
-                # If no domain, show public notes and their own notes
-                queryset = queryset.filter(
-                    Q(is_public=True) | Q(author=user)
-                )
-        else:
-            # Board members can see public notes, notes in their domain, or notes they created
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(domain=user.domain, is_public=True) | 
-                    Q(author=user) |
-                    Q(is_public=True)
-                )
-            else:
-                # If no domain, show public notes and their own notes
-                queryset = queryset.filter(
-                    Q(is_public=True) | Q(author=user)
-                )
+        queryset = get_visible_notes(self.request.user)
         
         # Apply filters only if there are query parameters
         if self.request.query_params:
@@ -73,15 +95,18 @@ class NoteListView(generics.ListCreateAPIView):
                 if filters.validated_data.get('is_public') is not None:
                     queryset = queryset.filter(is_public=filters.validated_data['is_public'])
                 if filters.validated_data.get('search'):
-                    search = filters.validated_data['search']
+                    queryset = filter_notes(queryset, filters.validated_data['search'])
+                if filters.validated_data.get('tags'):
+                    # Exact match on any of the comma-separated tags, via the tag index
+                    names = normalize_tags(filters.validated_data['tags'])
                     queryset = queryset.filter(
-                        Q(title__icontains=search) | 
-                        Q(description__icontains=search) |
-                        Q(purpose__icontains=search)
+                        Exists(NoteTag.objects.filter(note=OuterRef('pk'), tag__name__in=names))
+                    )
+                if filters.validated_data.get('tag_prefix'):
+                    prefix = filters.validated_data['tag_prefix'].strip().lower()
+                    queryset = queryset.filter(
+                        Exists(NoteTag.objects.filter(note=OuterRef('pk'), tag__name__startswith=prefix))
                     )
-                if filters.validated_data.get('tags'):
-                    tags = filters.validated_data['tags']
-                    queryset = queryset.filter(tags__icontains=tags)
         
         return queryset
 
@@ -102,50 +127,87 @@ class NoteListView(generics.ListCreateAPIView):
         note = serializer.save()
         return note
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).select_related('author')
+        if self.excerpt_mode():
+            # Only the leading characters of the long text columns leave the database
+            length = settings.NOTE_EXCERPT_LENGTH + 1
+            queryset = queryset.defer('description', 'purpose').annotate(
+                description_excerpt=Substr('description', 1, length),
+                purpose_excerpt=Substr('purpose', 1, length),
+            )
+        
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class NoteTagFacetView(NoteListView):
+    """
+    Tag counts over the notes matching the note list's scope and filters,
+    computed with one grouped query on the tag index.
+    """
+    http_method_names = ['get', 'head', 'options']
+    
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), 500)
+        except ValueError:
+            limit = 50
+        
+        notes = self.filter_queryset(self.get_queryset()).order_by().values('pk')
+        facets = NoteTag.objects.filter(note__in=notes)
+        prefix = request.query_params.get('prefix', '').strip().lower()
+        if prefix:
+            facets = facets.filter(tag__name__startswith=prefix)
+        
+        facets = facets.values('tag__name').annotate(count=Count('pk')).order_by('-count', 'tag__name')[:limit]
+        return Response([{'tag': row['tag__name'], 'count': row['count']} for row in facets])
+
+
+class NoteSearchView(NoteListView):
+    """
+    Paginated full-text search over the notes matching the note list's scope
+    and filters, best match first, with highlighted titles and snippets.
+    """
+    http_method_names = ['get', 'head', 'options']
+    pagination_class = PageNumberPagination
+    serializer_class = NoteSearchResultSerializer
+    
+    def get_serializer_class(self):
+        return self.serializer_class
+    
+    def get(self, request, *args, **kwargs):
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            return Response(
+                {'error': 'q is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        results = NoteSearchResults(self.get_queryset(), text)
+        page = self.paginate_queryset(results)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
 
 class NoteDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = NoteSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        queryset = Note.objects.all()
-        
-        # Apply role-based filtering
-        if user.is_admin:
-            pass
-        elif user.is_senior_council:
-            pass
-        elif user.is_junior_council:
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(domain=user.domain) | Q(is_public=True) | Q(author=user)
-                )
-            else:
-                # If no domain, show public notes and their own notes
-                queryset = queryset.filter(
-                    Q(is_public=True) | Q(author=user)
-                )
-        else:
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(domain=user.domain, is_public=True) | 
-                    Q(author=user) |
-                    Q(is_public=True)
-                )
-            else:
-                # If no domain, show public notes and their own notes
-                queryset = queryset.filter(
-                    Q(is_public=True) | Q(author=user)
-                )
-        
-        return queryset
+        return get_visible_notes(self.request.user)
     
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return NoteUpdateSerializer
         return NoteSerializer
     
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        note_views.record_view(response.data['id'])
+        return response
+    
     def destroy(self, request, *args, **kwargs):
         # Only admin and senior council can delete notes
         if not request.user.can_manage_notes():
@@ -156,6 +218,24 @@ class NoteDetailView(generics.RetrieveUpdateDestroyAPIView):
         return super().destroy(request, *args, **kwargs)
 
 
+class NoteRevisionPagination(CursorPagination):
+    page_size = 20
+    ordering = '-number'
+
+
+class NoteRevisionListView(generics.ListAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = NoteRevisionSerializer
+    pagination_class = NoteRevisionPagination
+    
+    def get_queryset(self):
+        note = generics.get_object_or_404(
+            get_visible_notes(self.request.user), pk=self.kwargs.get('note_id')
+        )
+        # Only the metadata is listed; the stored snapshots and deltas stay in the database
+        return NoteRevision.objects.filter(note=note).select_related('author').defer('data')
+
+
 class NoteCommentView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = NoteCommentSerializer
@@ -182,56 +262,69 @@ class NoteCommentDetailView(generics.RetrieveUpdateDestroyAPIView):
 @permission_classes([IsAuthenticated])
 def note_statistics(request):
     """Get note statistics for dashboard"""
-    user = request.user
+    notes = get_visible_notes(request.user)
+    return Response(get_note_statistics(request.user, notes))
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def popular_notes(request):
+    """Most read visible notes, with recent views weighing more"""
+    try:
+        limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+    except ValueError:
+        limit = 10
     
-    # Base queryset based on user role
-    if user.is_admin:
-        notes = Note.objects.all()
-    elif user.is_senior_council:
-        notes = Note.objects.all()
-    elif user.is_junior_council:
-        if user.domain:
-            notes = Note.objects.filter(
-                Q(domain=user.domain) | Q(is_public=True) | Q(author=user)
-            )
-        else:
-            notes = Note.objects.filter(
-                Q(is_public=True) | Q(author=user)
-            )
-    else:
-        if user.domain:
-            notes = Note.objects.filter(
-                Q(domain=user.domain, is_public=True) | 
-                Q(author=user) |
-                Q(is_public=True)
-            )
-        else:
-            notes = Note.objects.filter(
-                Q(is_public=True) | Q(author=user)
-            )
+    notes = get_visible_notes(request.user).filter(popularity__isnull=False).select_related('author').order_by(
+        '-popularity'
+    )[:limit]
+    now = timezone.now()
+    return Response([
+        {
+            **NoteListSerializer(note).data,
+            'view_count': note.view_count,
+            'score': round(decayed_score(note.popularity, now), 2),
+        }
+        for note in notes
+    ])
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def note_revision(request, note_id, number):
+    """Rebuild a note as it was at the given revision"""
+    note = generics.get_object_or_404(get_visible_notes(request.user), pk=note_id)
+    state = reconstruct(note.pk, number)
+    if state is None:
+        return Response({'error': 'Revision not found.'}, status=status.HTTP_404_NOT_FOUND)
+    return Response({'number': number, **state})
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def note_revision_diff(request, note_id):
+    """Changes between revisions ``from`` and ``to`` of a note"""
+    note = generics.get_object_or_404(get_visible_notes(request.user), pk=note_id)
+    try:
+        old_number = int(request.query_params['from'])
+        new_number = int(request.query_params['to'])
+    except (KeyError, ValueError):
+        return Response(
+            {'error': 'from and to must be revision numbers'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
-    # Calculate statistics
-    total_notes = notes.count()
-    high_priority_notes = notes.filter(priority='high').count()
-    urgent_notes = notes.filter(priority='urgent').count()
-    public_notes = notes.filter(is_public=True).count()
-    private_notes = notes.filter(is_public=False).count()
-    
-    # Notes by domain
-    domain_stats = {}
-    for domain_choice in user.DOMAIN_CHOICES:
-        domain_code = domain_choice[0]
-        domain_count = notes.filter(domain=domain_code).count()
-        if domain_count > 0:
-            domain_stats[domain_code] = domain_count
+    # Each side is rebuilt from its own nearest snapshot, so the revisions
+    # between the two are never loaded
+    old_state = reconstruct(note.pk, old_number)
+    new_state = reconstruct(note.pk, new_number)
+    if old_state is None or new_state is None:
+        return Response({'error': 'Revision not found.'}, status=status.HTTP_404_NOT_FOUND)
     
     return Response({
-        'total_notes': total_notes,
-        'high_priority_notes': high_priority_notes,
-        'urgent_notes': urgent_notes,
-        'public_notes': public_notes,
-        'private_notes': private_notes,
-        'domain_stats': domain_stats,
+        'from': old_number,
+        'to': new_number,
+        'changes': diff_states(old_state, new_state),
     })
 
 
@@ -247,5 +340,5 @@ def my_notes(request):
     if priority_filter:
         notes = notes.filter(priority=priority_filter)
     
-    serializer = NoteListSerializer(notes, many=True)
-    return Response(serializer.data) 
\ No newline at end of file
+    notes = notes.select_related('author')
+    return StreamingJSONResponse(serialize_queryset(notes, NoteListSerializer)) 
\ No newline at end of file
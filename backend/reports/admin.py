@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import UserActivity, Attendance, PerformanceMetric, Report, DashboardWidget
+from .models import UserActivity, Attendance, PerformanceMetric, Report, DashboardWidget, DailyUserStats
 
 
 @admin.register(UserActivity)
@@ -11,6 +11,15 @@ class UserActivityAdmin(admin.ModelAdmin):
     date_hierarchy = 'timestamp'
 
 
+@admin.register(DailyUserStats)
+class DailyUserStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'date', 'activities', 'logins', 'task_events', 'note_events']
+    list_filter = ['date']
+    search_fields = ['user__username']
+    ordering = ['-date']
+    date_hierarchy = 'date'
+
+
 @admin.register(Attendance)
 class AttendanceAdmin(admin.ModelAdmin):
     list_display = ['user', 'meeting_title', 'meeting_date', 'status']
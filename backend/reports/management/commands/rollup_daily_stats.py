@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from reports.rollup import rollup_daily_stats
+
+
+class Command(BaseCommand):
+    help = 'Fold new user activity rows into the daily user stats (run periodically, e.g. from cron)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=10000, help='Source row ids processed per transaction')
+    
+    def handle(self, *args, **options):
+        processed = rollup_daily_stats(chunk_size=options['chunk_size'])
+        summary = ', '.join(f'{source}: {count}' for source, count in processed.items())
+        self.stdout.write(self.style.SUCCESS(f'Rolled up daily stats ({summary})'))
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:42
+
+from django.db import migrations, models
+
+
+def drop_task_completion_cursor(apps, schema_editor):
+    """Completed tasks are now counted from task state instead of rolled up"""
+    RollupCursor = apps.get_model('reports', 'RollupCursor')
+    RollupCursor.objects.filter(source='task_completions').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0005_activity_client_timestamp'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='dailyuserstats',
+            name='tasks_completed',
+        ),
+        migrations.AddField(
+            model_name='rollupcursor',
+            name='seen_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='rollupcursor',
+            name='seen_id',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(drop_task_completion_cursor, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-19 05:01
+
+from django.db import migrations
+
+
+def drop_live_source_cursors(apps, schema_editor):
+    """Notes and attendance are now counted from current state instead of rolled up"""
+    RollupCursor = apps.get_model('reports', 'RollupCursor')
+    RollupCursor.objects.filter(source__in=['notes', 'attendance']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0006_rollup_settle'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='dailyuserstats',
+            name='meetings_attended',
+        ),
+        migrations.RemoveField(
+            model_name='dailyuserstats',
+            name='meetings_total',
+        ),
+        migrations.RemoveField(
+            model_name='dailyuserstats',
+            name='notes_created',
+        ),
+        migrations.RunPython(drop_live_source_cursors, migrations.RunPython.noop),
+    ]
@@ -11,17 +11,64 @@ class UserActivity(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activities')
     activity_type = models.CharField(max_length=50)  # login, task_completed, note_created, etc.
     description = models.TextField(blank=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add, so batched events can keep their client timestamps
+    timestamp = models.DateTimeField(default=timezone.now)
     metadata = models.JSONField(default=dict)  # Additional data like task_id, note_id, etc.
     
     class Meta:
         db_table = 'user_activities'
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['timestamp'], name='activities_timestamp_idx'),
+            models.Index(fields=['user', 'timestamp'], name='activities_user_time_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.activity_type} at {self.timestamp}"
 
 
+class DailyUserStats(models.Model):
+    """
+    Per-user, per-day activity counts rolled up from UserActivity by the
+    rollup_daily_stats command (see reports.rollup).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+    activities = models.PositiveIntegerField(default=0)
+    logins = models.PositiveIntegerField(default=0)
+    task_events = models.PositiveIntegerField(default=0)
+    note_events = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'daily_user_stats'
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='reports_unique_daily_user_stats'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.date}"
+
+
+class RollupCursor(models.Model):
+    """
+    High-water mark: the last source row id already folded into
+    DailyUserStats, and the highest id seen on an earlier run, which becomes
+    the next mark once it has settled.
+    """
+    source = models.CharField(max_length=50, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    seen_id = models.BigIntegerField(default=0)
+    seen_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'rollup_cursors'
+    
+    def __str__(self):
+        return f"{self.source} @ {self.last_id}"
+
+
 class Attendance(models.Model):
     """Track meeting attendance"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='attendances')
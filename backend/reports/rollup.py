@@ -0,0 +1,226 @@
+"""
+Incremental per-user daily rollups of the event tables.
+
+Each rolled-up source is an append-only table (user activities). The
+rollup_daily_stats command folds the rows added since the source's high-water
+mark into DailyUserStats, in id ranges, advancing the mark in the same
+transaction so a row is never counted twice.
+
+Ids are allocated before their transaction commits, so a row can become
+visible after a higher id has already been read. The mark therefore only
+advances to the highest id seen at least REPORT_ROLLUP_SETTLE_SECONDS earlier,
+by which time every transaction holding a lower id has finished.
+
+Reports read the rolled-up days plus the handful of rows past each mark, so a
+window costs at most one small row per user and day instead of a scan of the
+raw events.
+
+Completed tasks, notes and attendance records are not append-only: a task can
+be reopened or reassigned, a note deleted, an attendance status corrected. A
+rolled-up day would keep counting them as they were, so they are counted live
+from the tables' current state, one grouped query per source and window.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from notes.models import Note
+from tasks.models import Task
+
+from .models import Attendance, DailyUserStats, RollupCursor, UserActivity
+from .timeseries import day_bounds
+
+STAT_FIELDS = ['activities', 'logins', 'task_events', 'note_events']
+
+
+class RollupSource:
+    def __init__(self, name, queryset, user_field, time_field, counts, is_date=False):
+        self.name = name
+        self._queryset = queryset
+        self.user_field = user_field
+        self.time_field = time_field
+        self.counts = counts
+        self.is_date = is_date
+
+    def queryset(self):
+        return self._queryset()
+
+    def in_window(self, queryset, start_date, end_date):
+        if self.is_date:
+            return queryset.filter(**{
+                f'{self.time_field}__gte': start_date, f'{self.time_field}__lte': end_date
+            })
+        start, end = day_bounds(start_date, end_date)
+        return queryset.filter(**{f'{self.time_field}__gte': start, f'{self.time_field}__lt': end})
+
+    def grouped(self, queryset, by_day=True):
+        """Counts per user (and per day), as rows with ``user_id`` and ``day`` keys"""
+        queryset = queryset.filter(**{f'{self.user_field}__isnull': False})
+        keys = {'user_id': self.user_field}
+        if by_day and self.is_date:
+            keys['day'] = self.time_field
+        elif by_day:
+            queryset = queryset.annotate(day=TruncDate(self.time_field))
+            keys['day'] = 'day'
+        rows = queryset.values(*keys.values()).annotate(**{
+            field: Count('pk', filter=condition) if condition is not None else Count('pk')
+            for field, condition in self.counts.items()
+        }).order_by()
+        for row in rows:
+            yield {
+                **{key: row[lookup] for key, lookup in keys.items()},
+                **{field: row[field] for field in self.counts},
+            }
+
+
+# Rolled up into DailyUserStats
+SOURCES = [
+    RollupSource(
+        'activities',
+        lambda: UserActivity.objects.all(),
+        'user', 'timestamp',
+        {
+            'activities': None,
+            'logins': Q(activity_type='login'),
+            'task_events': Q(activity_type__startswith='task_'),
+            'note_events': Q(activity_type__startswith='note_'),
+        },
+    ),
+]
+
+# Counted from current state on every report
+LIVE_SOURCES = [
+    RollupSource(
+        'tasks_completed',
+        lambda: Task.objects.filter(status='completed'),
+        'assigned_to', 'completed_at',
+        {'tasks_completed': None},
+    ),
+    RollupSource(
+        'notes',
+        lambda: Note.objects.all(),
+        'author', 'created_at',
+        {'notes_created': None},
+    ),
+    RollupSource(
+        'attendance',
+        lambda: Attendance.objects.all(),
+        'user', 'meeting_date',
+        {'meetings_total': None, 'meetings_attended': Q(status='present')},
+        is_date=True,
+    ),
+]
+
+LIVE_FIELDS = [field for source in LIVE_SOURCES for field in source.counts]
+
+
+def merge_increments(rows):
+    """Add per-(user, day) counts to DailyUserStats, creating missing rows"""
+    increments = {}
+    for row in rows:
+        counts = increments.setdefault((row['user_id'], row['day']), {})
+        for field in STAT_FIELDS:
+            if row.get(field):
+                counts[field] = counts.get(field, 0) + row[field]
+    if not increments:
+        return
+
+    existing = {
+        (stats.user_id, stats.date): stats
+        for stats in DailyUserStats.objects.filter(
+            user_id__in={user_id for user_id, _ in increments},
+            date__in={day for _, day in increments},
+        )
+    }
+    created = []
+    for (user_id, day), counts in increments.items():
+        stats = existing.get((user_id, day))
+        if stats is None:
+            created.append(DailyUserStats(user_id=user_id, date=day, **counts))
+            continue
+        for field, count in counts.items():
+            setattr(stats, field, getattr(stats, field) + count)
+
+    DailyUserStats.objects.bulk_update(list(existing.values()), STAT_FIELDS, batch_size=500)
+    DailyUserStats.objects.bulk_create(created, batch_size=500)
+
+
+def settled_max_id(cursor, max_id, now):
+    """
+    Highest id that is safe to roll up now, recording ``max_id`` to be
+    settled on a later run
+    """
+    settle = timedelta(seconds=settings.REPORT_ROLLUP_SETTLE_SECONDS)
+    if not settle:
+        return max_id
+    if cursor.seen_at is None:
+        cursor.seen_id, cursor.seen_at = max_id, now
+        return cursor.last_id
+    if cursor.seen_at > now - settle:
+        return cursor.last_id
+    settled = cursor.seen_id
+    cursor.seen_id, cursor.seen_at = max_id, now
+    return settled
+
+
+def rollup_source(source, chunk_size=10000):
+    """Fold settled rows past the source's high-water mark into the rollup; returns rows covered"""
+    cursor, _ = RollupCursor.objects.get_or_create(source=source.name)
+    max_id = source.queryset().aggregate(max_id=Max('pk'))['max_id'] or 0
+    target_id = settled_max_id(cursor, max_id, timezone.now())
+    start_id = cursor.last_id
+
+    while cursor.last_id < target_id:
+        upper = min(cursor.last_id + chunk_size, target_id)
+        with transaction.atomic():
+            rows = source.grouped(source.queryset().filter(pk__gt=cursor.last_id, pk__lte=upper))
+            merge_increments(rows)
+            cursor.last_id = upper
+            cursor.save(update_fields=['last_id', 'updated_at'])
+
+    cursor.save(update_fields=['seen_id', 'seen_at', 'updated_at'])
+    return cursor.last_id - start_id
+
+
+def rollup_daily_stats(chunk_size=10000):
+    return {source.name: rollup_source(source, chunk_size) for source in SOURCES}
+
+
+def user_totals(user_ids, start_date, end_date):
+    """
+    Per-user sums of every stat over the window: the rolled-up days, plus
+    the rows each source has received since its last rollup, plus the live
+    counts.
+    """
+    totals = {user_id: dict.fromkeys(STAT_FIELDS + LIVE_FIELDS, 0) for user_id in user_ids}
+    if not totals:
+        return totals
+
+    rolled_up = DailyUserStats.objects.filter(
+        user_id__in=user_ids, date__gte=start_date, date__lte=end_date
+    ).values('user_id').annotate(**{field: Sum(field) for field in STAT_FIELDS}).order_by()
+    for row in rolled_up:
+        for field in STAT_FIELDS:
+            totals[row['user_id']][field] += row[field] or 0
+
+    marks = dict(RollupCursor.objects.values_list('source', 'last_id'))
+    for source in SOURCES:
+        pending = source.queryset().filter(
+            pk__gt=marks.get(source.name, 0),
+            **{f'{source.user_field}__in': user_ids}
+        )
+        for row in source.grouped(source.in_window(pending, start_date, end_date), by_day=False):
+            for field in source.counts:
+                totals[row['user_id']][field] += row[field]
+
+    for source in LIVE_SOURCES:
+        current = source.queryset().filter(**{f'{source.user_field}__in': user_ids})
+        for row in source.grouped(source.in_window(current, start_date, end_date), by_day=False):
+            for field in source.counts:
+                totals[row['user_id']][field] = row[field]
+
+    return totals
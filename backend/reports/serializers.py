@@ -1,4 +1,7 @@
+from datetime import timedelta
 from rest_framework import serializers
+from django.conf import settings
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from .models import UserActivity, Attendance, PerformanceMetric, Report, DashboardWidget
 
@@ -97,4 +100,21 @@ class ActivitySummarySerializer(serializers.Serializer):
     login_count = serializers.IntegerField()
     task_activities = serializers.IntegerField()
     note_activities = serializers.IntegerField()
-    total_activities = serializers.IntegerField() 
\ No newline at end of file
+    total_activities = serializers.IntegerField() 
+
+class ActivityEventSerializer(serializers.Serializer):
+    activity_type = serializers.CharField(max_length=50)
+    description = serializers.CharField(required=False, allow_blank=True, default='')
+    metadata = serializers.DictField(required=False, default=dict)
+    # Client-side time of the event; defaults to the time it is received
+    timestamp = serializers.DateTimeField(required=False)
+    
+    def validate_timestamp(self, value):
+        now = timezone.now()
+        if value > now + timedelta(minutes=5):
+            raise serializers.ValidationError('Timestamp is in the future.')
+        if value < now - timedelta(days=settings.ACTIVITY_BATCH_MAX_AGE_DAYS):
+            raise serializers.ValidationError(
+                f'Timestamp is more than {settings.ACTIVITY_BATCH_MAX_AGE_DAYS} days old.'
+            )
+        return value
@@ -0,0 +1,88 @@
+"""
+Helpers for building per-day report series from grouped queries.
+"""
+import math
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def day_bounds(start_date, end_date):
+    """Half-open [start, end) datetimes covering whole local days, for indexable range filters"""
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+    end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), tz)
+    return start, end
+
+
+def date_range(start_date, end_date):
+    current = start_date
+    while current <= end_date:
+        yield current
+        current += timedelta(days=1)
+
+
+def fill_daily(rows, start_date, end_date, key='day', fields=('count',)):
+    """
+    Expand grouped rows (one per day that had data) into one row per day in
+    the range, with zeros for the days that had none.
+    """
+    by_day = {row[key]: row for row in rows}
+    empty = {field: 0 for field in fields}
+    return [
+        {'date': day, **{field: by_day.get(day, empty)[field] or 0 for field in fields}}
+        for day in date_range(start_date, end_date)
+    ]
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def cached_daily_counts(queryset, field, start_date, end_date, cache_prefix):
+    """
+    Row counts per local day of ``field`` over the range, as {date: count}.
+
+    Finished days are cached under ``cache_prefix`` and never recomputed;
+    the days that are missing from the cache, plus today, are counted with a
+    single grouped query.
+    """
+    today = timezone.localdate()
+    past_days = list(date_range(start_date, min(end_date, today - timedelta(days=1))))
+    keys = {day: f'{cache_prefix}:{day.isoformat()}' for day in past_days}
+    cached = cache.get_many(keys.values())
+    counts = {day: cached[key] for day, key in keys.items() if key in cached}
+
+    missing = [day for day in date_range(start_date, end_date) if day not in counts]
+    if not missing:
+        return counts
+
+    start, end = day_bounds(missing[0], missing[-1])
+    rows = queryset.filter(**{f'{field}__gte': start, f'{field}__lt': end}).annotate(
+        day=TruncDate(field)
+    ).values('day').annotate(count=Count('pk')).order_by()
+    fetched = {row['day']: row['count'] for row in rows}
+
+    for day in missing:
+        counts[day] = fetched.get(day, 0)
+    cache.set_many(
+        {keys[day]: counts[day] for day in missing if day in keys},
+        settings.REPORT_DAILY_CACHE_TIMEOUT
+    )
+    return counts
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
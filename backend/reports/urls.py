@@ -2,7 +2,7 @@ from django.urls import path
 from .views import (
     ReportListView, ReportDetailView, DashboardWidgetView, DashboardWidgetDetailView,
     user_performance_report, team_performance_report, activity_summary,
-    track_activity, dashboard_metrics, performance_data
+    track_activity, track_activity_batch, dashboard_metrics, performance_data, task_trends
 )
 
 urlpatterns = [
@@ -22,6 +22,8 @@ urlpatterns = [
     # Activity and metrics
     path('activity-summary/', activity_summary, name='activity_summary'),
     path('track-activity/', track_activity, name='track_activity'),
+    path('track-activity/batch/', track_activity_batch, name='track_activity_batch'),
     path('dashboard-metrics/', dashboard_metrics, name='dashboard_metrics'),
     path('performance-data/', performance_data, name='performance_data'),
+    path('task-trends/', task_trends, name='task_trends'),
 ] 
\ No newline at end of file
@@ -2,22 +2,47 @@ from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.db.models import Q, Count, Avg, Sum
+from django.db.models import Q, F, Count, Avg, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from itertools import accumulate
+from statistics import fmean
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 from .models import UserActivity, Attendance, PerformanceMetric, Report, DashboardWidget
 from .serializers import (
     UserActivitySerializer, AttendanceSerializer, PerformanceMetricSerializer,
     ReportSerializer, DashboardWidgetSerializer, ReportFilterSerializer,
-    PerformanceReportSerializer, TeamPerformanceSerializer, ActivitySummarySerializer
+    PerformanceReportSerializer, TeamPerformanceSerializer, ActivitySummarySerializer,
+    ActivityEventSerializer
 )
 from users.permissions import CanViewAllReports
-from tasks.models import Task
+from .rollup import user_totals
+from .timeseries import (
+    cached_daily_counts, date_range, day_bounds, fill_daily, percentile, week_start
+)
+from tasks.models import Task, TaskHistory
+from tasks.queries import get_visible_tasks, overdue_q
 from notes.models import Note
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+CLOSED_STATUSES = ['completed', 'cancelled']
+
+MAX_REPORT_DAYS = 365
+
+
+def parse_days(request, default):
+    """``?days=`` as a positive integer capped at MAX_REPORT_DAYS, or None if invalid"""
+    try:
+        days = int(request.query_params.get('days', default))
+    except ValueError:
+        return None
+    if days <= 0:
+        return None
+    return min(days, MAX_REPORT_DAYS)
+
 
 class ReportListView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
@@ -61,112 +86,132 @@ class DashboardWidgetDetailView(generics.RetrieveUpdateDestroyAPIView):
         return DashboardWidget.objects.filter(user=self.request.user)
 
 
+def build_performance_reports(target_users, start_date, end_date):
+    """
+    Performance report rows for many users at once, from the daily rollup
+    plus one conditional aggregate over the users' open tasks.
+    """
+    user_ids = [target_user.id for target_user in target_users]
+    
+    # Windowed counts come from the daily rollup; open task counts are current state
+    totals = user_totals(user_ids, start_date, end_date)
+    open_tasks = {
+        row.pop('assigned_to'): row
+        for row in Task.objects.filter(assigned_to__in=user_ids).filter(
+            Q(status='pending') | overdue_q()
+        ).values('assigned_to').annotate(
+            pending=Count('pk', filter=Q(status='pending')),
+            overdue=Count('pk', filter=overdue_q()),
+        ).order_by()
+    }
+    
+    reports = []
+    for target_user in target_users:
+        stats = totals[target_user.id]
+        user_tasks = open_tasks.get(target_user.id, {})
+        tasks_completed = stats['tasks_completed']
+        notes_created = stats['notes_created']
+        total_meetings = stats['meetings_total']
+        attended_meetings = stats['meetings_attended']
+        activity_count = stats['activities']
+        
+        attendance_rate = (attended_meetings / total_meetings * 100) if total_meetings > 0 else 0
+        
+        # Calculate performance score (simple algorithm)
+        performance_score = min(100, (
+            (tasks_completed * 10) +
+            (notes_created * 5) +
+            (attendance_rate * 0.5) +
+            (activity_count * 2)
+        ))
+        
+        reports.append({
+            'user_id': target_user.id,
+            'username': target_user.username,
+            'role': target_user.role,
+            'domain': target_user.domain or '',
+            'tasks_completed': tasks_completed,
+            'tasks_pending': user_tasks.get('pending', 0),
+            'tasks_overdue': user_tasks.get('overdue', 0),
+            'notes_created': notes_created,
+            'attendance_rate': round(attendance_rate, 2),
+            'activity_count': activity_count,
+            'performance_score': round(performance_score, 2),
+        })
+    return reports
+
+
+def reportable_users(user):
+    """Users whose performance reports ``user`` may view, other than their own"""
+    if user.is_admin or user.is_senior_council:
+        return User.objects.all()
+    if user.is_junior_council and user.domain:
+        # Junior council can only view board members in their domain
+        return User.objects.filter(role='board_member', domain=user.domain)
+    return User.objects.none()
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_performance_report(request, user_id=None):
-    """Get performance report for a specific user or current user"""
+    """
+    Get performance report for a specific user or current user, or for
+    several users at once with ``?user_ids=1,2,3``
+    """
     user = request.user
     
+    # Get date range from query params
+    days = parse_days(request, 30)
+    if days is None:
+        return Response(
+            {'error': 'days must be a positive integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    end_date = timezone.localdate()
+    start_date = end_date - timedelta(days=days)
+    
+    user_ids = request.query_params.get('user_ids')
+    if user_ids and not user_id:
+        try:
+            requested = list(dict.fromkeys(int(value) for value in user_ids.split(',') if value.strip()))
+        except ValueError:
+            return Response(
+                {'error': 'user_ids must be a comma-separated list of ids'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(requested) > 200:
+            return Response(
+                {'error': 'At most 200 users can be requested at once.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Users the caller may not view are left out of the result
+        allowed = reportable_users(user) | User.objects.filter(pk=user.pk)
+        found = allowed.filter(id__in=requested).in_bulk()
+        target_users = [found[target_id] for target_id in requested if target_id in found]
+        
+        serializer = PerformanceReportSerializer(
+            build_performance_reports(target_users, start_date, end_date), many=True
+        )
+        return Response(serializer.data)
+    
     # Check permissions for viewing other users' reports
     if user_id:
-        if user.is_admin or user.is_senior_council:
-            target_user = User.objects.get(id=user_id)
-        elif user.is_junior_council:
-            # Junior council can only view board members in their domain
-            if user.domain:
-                target_user = User.objects.get(
-                    id=user_id, 
-                    role='board_member', 
-                    domain=user.domain
-                )
-            else:
-                return Response(
-                    {'error': 'You do not have permission to view this user\'s report.'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-        else:
+        if user.is_junior_council and not user.domain:
+            return Response(
+                {'error': 'You do not have permission to view this user\'s report.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        if not (user.is_admin or user.is_senior_council or user.is_junior_council):
             return Response(
                 {'error': 'You do not have permission to view other users\' reports.'},
                 status=status.HTTP_403_FORBIDDEN
             )
+        target_user = generics.get_object_or_404(reportable_users(user), id=user_id)
     else:
         target_user = user
     
-    # Get date range from query params
-    days = int(request.query_params.get('days', 30))
-    end_date = timezone.now().date()
-    start_date = end_date - timedelta(days=days)
-    
-    # Calculate metrics
-    tasks_completed = Task.objects.filter(
-        assigned_to=target_user,
-        status='completed',
-        completed_at__date__gte=start_date,
-        completed_at__date__lte=end_date
-    ).count()
-    
-    tasks_pending = Task.objects.filter(
-        assigned_to=target_user,
-        status='pending'
-    ).count()
-    
-    tasks_overdue = Task.objects.filter(
-        assigned_to=target_user,
-        status__in=['pending', 'in_progress'],
-        due_date__lt=timezone.now()
-    ).count()
-    
-    notes_created = Note.objects.filter(
-        author=target_user,
-        created_at__date__gte=start_date,
-        created_at__date__lte=end_date
-    ).count()
-    
-    # Calculate attendance rate
-    total_meetings = Attendance.objects.filter(
-        user=target_user,
-        meeting_date__gte=start_date,
-        meeting_date__lte=end_date
-    ).count()
-    
-    attended_meetings = Attendance.objects.filter(
-        user=target_user,
-        meeting_date__gte=start_date,
-        meeting_date__lte=end_date,
-        status='present'
-    ).count()
-    
-    attendance_rate = (attended_meetings / total_meetings * 100) if total_meetings > 0 else 0
-    
-    # Activity count
-    activity_count = UserActivity.objects.filter(
-        user=target_user,
-        timestamp__date__gte=start_date,
-        timestamp__date__lte=end_date
-    ).count()
-    
-    # Calculate performance score (simple algorithm)
-    performance_score = min(100, (
-        (tasks_completed * 10) +
-        (notes_created * 5) +
-        (attendance_rate * 0.5) +
-        (activity_count * 2)
-    ))
-    
-    data = {
-        'user_id': target_user.id,
-        'username': target_user.username,
-        'role': target_user.role,
-        'domain': target_user.domain or '',
-        'tasks_completed': tasks_completed,
-        'tasks_pending': tasks_pending,
-        'tasks_overdue': tasks_overdue,
-        'notes_created': notes_created,
-        'attendance_rate': round(attendance_rate, 2),
-        'activity_count': activity_count,
-        'performance_score': round(performance_score, 2),
-    }
-    
+    data = build_performance_reports([target_user], start_date, end_date)[0]
     serializer = PerformanceReportSerializer(data)
     return Response(serializer.data)
 
@@ -189,8 +234,13 @@ def team_performance_report(request):
         domain = user.domain  # Junior council can only see their domain
     
     # Get date range
-    days = int(request.query_params.get('days', 30))
-    end_date = timezone.now().date()
+    days = parse_days(request, 30)
+    if days is None:
+        return Response(
+            {'error': 'days must be a positive integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    end_date = timezone.localdate()
     start_date = end_date - timedelta(days=days)
     
     # Get users based on role
@@ -206,67 +256,55 @@ def team_performance_report(request):
     if domain:
         users = users.filter(domain=domain)
     
-    team_data = []
+    start, end = day_bounds(start_date, end_date)
+    domain_codes = [code for code, _ in User.DOMAIN_CHOICES]
+    members = list(users.filter(domain__in=domain_codes).values_list('id', 'domain'))
+    member_ids = [member_id for member_id, _ in members]
+    
+    # Per-member counts from the daily rollup, whatever the club size
+    totals = user_totals(member_ids, start_date, end_date)
+    
+    domain_tasks = {
+        row['domain']: row
+        for row in Task.objects.filter(domain__in={domain for _, domain in members}).filter(
+            Q(created_at__gte=start, created_at__lt=end) |
+            Q(status='completed', completed_at__gte=start, completed_at__lt=end)
+        ).values('domain').annotate(
+            total=Count('pk', filter=Q(created_at__gte=start, created_at__lt=end)),
+            completed=Count('pk', filter=Q(status='completed', completed_at__gte=start, completed_at__lt=end)),
+        ).order_by()
+    }
     
-    for domain_choice in User.DOMAIN_CHOICES:
-        domain_code = domain_choice[0]
-        domain_users = users.filter(domain=domain_code)
+    # Per-member scores, then domain aggregates, in memory
+    scores = {}
+    active = {}
+    for member_id, member_domain in members:
+        stats = totals[member_id]
+        score = min(100, (
+            stats['tasks_completed'] * 10 +
+            stats['notes_created'] * 5 +
+            stats['activities'] * 2
+        ))
+        scores.setdefault(member_domain, []).append(score)
+        active[member_domain] = active.get(member_domain, 0) + (1 if stats['activities'] else 0)
+    
+    team_data = []
+    for domain_code in domain_codes:
+        if domain_code not in scores:
+            continue
+        total_tasks = domain_tasks.get(domain_code, {}).get('total', 0)
+        completed_tasks = domain_tasks.get(domain_code, {}).get('completed', 0)
+        completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
-        if domain_users.exists():
-            total_members = domain_users.count()
-            active_members = domain_users.filter(
-                activities__timestamp__date__gte=start_date
-            ).distinct().count()
-            
-            total_tasks = Task.objects.filter(
-                domain=domain_code,
-                created_at__date__gte=start_date,
-                created_at__date__lte=end_date
-            ).count()
-            
-            completed_tasks = Task.objects.filter(
-                domain=domain_code,
-                status='completed',
-                completed_at__date__gte=start_date,
-                completed_at__date__lte=end_date
-            ).count()
-            
-            completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-            
-            # Calculate average performance
-            performance_scores = []
-            for user in domain_users:
-                user_tasks = Task.objects.filter(
-                    assigned_to=user,
-                    status='completed',
-                    completed_at__date__gte=start_date,
-                    completed_at__date__lte=end_date
-                ).count()
-                user_notes = Note.objects.filter(
-                    author=user,
-                    created_at__date__gte=start_date,
-                    created_at__date__lte=end_date
-                ).count()
-                user_activities = UserActivity.objects.filter(
-                    user=user,
-                    timestamp__date__gte=start_date,
-                    timestamp__date__lte=end_date
-                ).count()
-                
-                score = min(100, (user_tasks * 10) + (user_notes * 5) + (user_activities * 2))
-                performance_scores.append(score)
-            
-            average_performance = sum(performance_scores) / len(performance_scores) if performance_scores else 0
-            
-            team_data.append({
-                'domain': domain_code,
-                'total_members': total_members,
-                'active_members': active_members,
-                'total_tasks': total_tasks,
-                'completed_tasks': completed_tasks,
-                'completion_rate': round(completion_rate, 2),
-                'average_performance': round(average_performance, 2),
-            })
+        team_data.append({
+            'domain': domain_code,
+            'total_members': len(scores[domain_code]),
+            'active_members': active[domain_code],
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'completion_rate': round(completion_rate, 2),
+            'average_performance': round(fmean(scores[domain_code]), 2),
+        })
     
     serializer = TeamPerformanceSerializer(team_data, many=True)
     return Response(serializer.data)
@@ -279,9 +317,15 @@ def activity_summary(request):
     user = request.user
     
     # Get date range
-    days = int(request.query_params.get('days', 7))
-    end_date = timezone.now().date()
+    days = parse_days(request, 7)
+    if days is None:
+        return Response(
+            {'error': 'days must be a positive integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    end_date = timezone.localdate()
     start_date = end_date - timedelta(days=days)
+    start, end = day_bounds(start_date, end_date)
     
     # Base queryset based on user role
     if user.is_admin:
@@ -293,29 +337,18 @@ def activity_summary(request):
     else:
         activities = UserActivity.objects.filter(user=user)
     
-    # Group by date
-    activity_summary = []
-    current_date = start_date
-    
-    while current_date <= end_date:
-        daily_activities = activities.filter(timestamp__date=current_date)
-        
-        login_count = daily_activities.filter(activity_type='login').count()
-        task_activities = daily_activities.filter(activity_type__startswith='task_').count()
-        note_activities = daily_activities.filter(activity_type__startswith='note_').count()
-        total_activities = daily_activities.count()
-        
-        activity_summary.append({
-            'date': current_date,
-            'login_count': login_count,
-            'task_activities': task_activities,
-            'note_activities': note_activities,
-            'total_activities': total_activities,
-        })
-        
-        current_date += timedelta(days=1)
-    
-    serializer = ActivitySummarySerializer(activity_summary, many=True)
+    # One grouped query for the whole range; days without activity are filled in below
+    fields = ('login_count', 'task_activities', 'note_activities', 'total_activities')
+    daily = activities.filter(timestamp__gte=start, timestamp__lt=end).annotate(
+        day=TruncDate('timestamp')
+    ).values('day').annotate(
+        login_count=Count('pk', filter=Q(activity_type='login')),
+        task_activities=Count('pk', filter=Q(activity_type__startswith='task_')),
+        note_activities=Count('pk', filter=Q(activity_type__startswith='note_')),
+        total_activities=Count('pk'),
+    ).order_by('day')
+    
+    serializer = ActivitySummarySerializer(fill_daily(daily, start_date, end_date, fields=fields), many=True)
     return Response(serializer.data)
 
 
@@ -343,6 +376,55 @@ def track_activity(request):
     return Response({'message': 'Activity tracked successfully'})
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def track_activity_batch(request):
+    """
+    Track many activities in one request; ``events`` is a list of activities
+    with optional client timestamps. Invalid events are reported per item and
+    the valid ones are inserted with a single bulk_create.
+    """
+    events = request.data.get('events') if isinstance(request.data, dict) else request.data
+    if not isinstance(events, list):
+        return Response(
+            {'error': 'events must be a list'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(events) > settings.ACTIVITY_BATCH_MAX_EVENTS:
+        return Response(
+            {'error': f'At most {settings.ACTIVITY_BATCH_MAX_EVENTS} events can be sent at once.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    activities = []
+    errors = []
+    received_at = timezone.now()
+    for index, event in enumerate(events):
+        if not isinstance(event, dict):
+            errors.append({'index': index, 'errors': {'non_field_errors': ['Event must be an object.']}})
+            continue
+        serializer = ActivityEventSerializer(data=event)
+        if not serializer.is_valid():
+            errors.append({'index': index, 'errors': serializer.errors})
+            continue
+        data = serializer.validated_data
+        activities.append(UserActivity(
+            user=request.user,
+            activity_type=data['activity_type'],
+            description=data['description'],
+            metadata=data['metadata'],
+            timestamp=data.get('timestamp', received_at),
+        ))
+    
+    UserActivity.objects.bulk_create(activities)
+    
+    response_status = status.HTTP_201_CREATED if activities else status.HTTP_400_BAD_REQUEST
+    return Response(
+        {'created': len(activities), 'error_count': len(errors), 'errors': errors},
+        status=response_status
+    )
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def dashboard_metrics(request):
@@ -371,10 +453,7 @@ def dashboard_metrics(request):
         active_tasks = Task.objects.filter(status__in=['pending', 'in_progress']).count()
         completed_tasks = Task.objects.filter(status='completed').count()
         pending_tasks = Task.objects.filter(status='pending').count()
-        overdue_tasks = Task.objects.filter(
-            status__in=['pending', 'in_progress'],
-            due_date__lt=now
-        ).count()
+        overdue_tasks = Task.objects.filter(overdue_q()).count()
         total_notes = Note.objects.all().count()
         performance_score = 98  # Admin performance is always high
         attendance_rate = 96
@@ -389,10 +468,7 @@ def dashboard_metrics(request):
         active_tasks = Task.objects.filter(status__in=['pending', 'in_progress']).count()
         completed_tasks = Task.objects.filter(status='completed').count()
         pending_tasks = Task.objects.filter(status='pending').count()
-        overdue_tasks = Task.objects.filter(
-            status__in=['pending', 'in_progress'],
-            due_date__lt=now
-        ).count()
+        overdue_tasks = Task.objects.filter(overdue_q()).count()
         total_notes = Note.objects.all().count()
         performance_score = 94
         attendance_rate = 96
@@ -420,11 +496,7 @@ def dashboard_metrics(request):
             domain=user.domain,
             status='pending'
         ).count()
-        overdue_tasks = Task.objects.filter(
-            domain=user.domain,
-            status__in=['pending', 'in_progress'],
-            due_date__lt=now
-        ).count()
+        overdue_tasks = Task.objects.filter(overdue_q(), domain=user.domain).count()
         total_notes = Note.objects.filter(domain=user.domain).count()
         performance_score = 87
         attendance_rate = 92
@@ -440,11 +512,7 @@ def dashboard_metrics(request):
         active_tasks = Task.objects.filter(assigned_to=user, status__in=['pending', 'in_progress']).count()
         completed_tasks = Task.objects.filter(assigned_to=user, status='completed').count()
         pending_tasks = Task.objects.filter(assigned_to=user, status='pending').count()
-        overdue_tasks = Task.objects.filter(
-            assigned_to=user,
-            status__in=['pending', 'in_progress'],
-            due_date__lt=now
-        ).count()
+        overdue_tasks = Task.objects.filter(overdue_q(), assigned_to=user).count()
         total_notes = Note.objects.filter(author=user).count()
         performance_score = 92
         attendance_rate = 98
@@ -470,7 +538,6 @@ def dashboard_metrics(request):
 def performance_data(request):
     """Get performance data for charts"""
     user = request.user
-    now = timezone.now()
     
     # Get date range
     time_filter = request.query_params.get('time_filter', '7d')
@@ -483,44 +550,149 @@ def performance_data(request):
     else:
         days = 7
     
-    end_date = now.date()
+    end_date = timezone.localdate()
     start_date = end_date - timedelta(days=days)
     
-    # Generate performance data for the period
-    performance_data = []
-    current_date = start_date
+    # Tasks counted per scope, and the baseline score of the viewer's role
+    if user.is_admin:
+        tasks, scope, base = Task.objects.all(), 'all', 95
+    elif user.is_senior_council:
+        tasks, scope, base = Task.objects.all(), 'all', 90
+    elif user.is_junior_council:
+        tasks, scope, base = Task.objects.filter(domain=user.domain), f'domain:{user.domain}', 85
+    else:
+        tasks, scope, base = Task.objects.filter(assigned_to=user), f'assignee:{user.pk}', 88
     
-    while current_date <= end_date:
-        # Calculate daily metrics
-        if user.is_admin:
-            daily_tasks = Task.objects.filter(
-                created_at__date=current_date
-            ).count()
-            daily_performance = 95 + (daily_tasks * 0.5)  # Base performance + task factor
-        elif user.is_senior_council:
-            daily_tasks = Task.objects.filter(
-                created_at__date=current_date
-            ).count()
-            daily_performance = 90 + (daily_tasks * 0.5)
-        elif user.is_junior_council:
-            daily_tasks = Task.objects.filter(
-                domain=user.domain,
-                created_at__date=current_date
-            ).count()
-            daily_performance = 85 + (daily_tasks * 0.5)
-        else:
-            daily_tasks = Task.objects.filter(
-                assigned_to=user,
-                created_at__date=current_date
-            ).count()
-            daily_performance = 88 + (daily_tasks * 0.5)
-        
-        performance_data.append({
-            'date': current_date.strftime('%Y-%m-%d'),
-            'performance': min(100, daily_performance),
-            'tasks': daily_tasks,
-        })
-        
-        current_date += timedelta(days=1)
+    daily_tasks = cached_daily_counts(
+        tasks, 'created_at', start_date, end_date, f'reports:performance:tasks:{scope}'
+    )
+    
+    performance_data = [
+        {
+            'date': day,
+            'performance': min(100, base + (daily_tasks[day] * 0.5)),
+            'tasks': daily_tasks[day],
+        }
+        for day in date_range(start_date, end_date)
+    ]
+    
+    # Long windows can be downsampled to one point per week (starting Monday)
+    if request.query_params.get('bucket') == 'week':
+        weeks = {}
+        for point in performance_data:
+            weeks.setdefault(week_start(point['date']), []).append(point)
+        performance_data = [
+            {
+                'date': week,
+                'performance': round(sum(point['performance'] for point in points) / len(points), 2),
+                'tasks': sum(point['tasks'] for point in points),
+            }
+            for week, points in weeks.items()
+        ]
+    
+    for point in performance_data:
+        point['date'] = point['date'].strftime('%Y-%m-%d')
+    return Response(performance_data) 
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def task_trends(request):
+    """Burndown, created-vs-completed and cycle-time series for a date range"""
+    user = request.user
+    
+    days = parse_days(request, 30)
+    if days is None:
+        return Response(
+            {'error': 'days must be a positive integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    end_date = timezone.localdate()
+    start_date = end_date - timedelta(days=days - 1)
+    start, end = day_bounds(start_date, end_date)
     
-    return Response(performance_data) 
\ No newline at end of file
+    tasks = get_visible_tasks(user)
+    domain = request.query_params.get('domain')
+    if domain:
+        tasks = tasks.filter(domain=domain)
+    
+    # Open backlog at the start of the range. A task's status then is the
+    # last status it changed to before the start; failing that, the one its
+    # first later change moved away from; failing that, its current status.
+    status_changes = TaskHistory.objects.filter(task=OuterRef('pk'), action='status_changed')
+    status_at_start = Coalesce(
+        Subquery(status_changes.filter(timestamp__lt=start).order_by('-timestamp', '-pk').values('new_value')[:1]),
+        Subquery(status_changes.filter(timestamp__gte=start).order_by('timestamp', 'pk').values('old_value')[:1]),
+        F('status'),
+    )
+    open_at_start = tasks.filter(created_at__lt=start).annotate(
+        status_at_start=status_at_start
+    ).exclude(status_at_start__in=CLOSED_STATUSES).count()
+    
+    created = fill_daily(
+        tasks.filter(created_at__gte=start, created_at__lt=end).annotate(
+            day=TruncDate('created_at')
+        ).values('day').annotate(count=Count('pk')).order_by('day'),
+        start_date, end_date
+    )
+    
+    # Status transitions per day: completions and cancellations close a task,
+    # reopening a completed or cancelled one puts it back on the burndown
+    closing = Q(new_value__in=CLOSED_STATUSES) & ~Q(old_value__in=CLOSED_STATUSES)
+    reopening = Q(old_value__in=CLOSED_STATUSES) & ~Q(new_value__in=CLOSED_STATUSES)
+    transitions = fill_daily(
+        TaskHistory.objects.filter(
+            task__in=tasks,
+            action='status_changed',
+            timestamp__gte=start,
+            timestamp__lt=end
+        ).filter(closing | reopening).annotate(day=TruncDate('timestamp')).values('day').annotate(
+            completed=Count('task', distinct=True, filter=closing & Q(new_value='completed')),
+            closed=Count('pk', filter=closing),
+            reopened=Count('pk', filter=reopening),
+        ).order_by('day'),
+        start_date, end_date, fields=('completed', 'closed', 'reopened')
+    )
+    
+    created_counts = [row['count'] for row in created]
+    completed_counts = [row['completed'] for row in transitions]
+    net_closed = [row['closed'] - row['reopened'] for row in transitions]
+    remaining = [
+        open_at_start + added - done
+        for added, done in zip(accumulate(created_counts), accumulate(net_closed))
+    ]
+    
+    series = [
+        {
+            'date': day['date'],
+            'created': added,
+            'completed': done,
+            'remaining': left,
+        }
+        for day, added, done, left in zip(created, created_counts, completed_counts, remaining)
+    ]
+    
+    # Cycle time of tasks completed in the range, in hours
+    cycle_times = sorted(
+        (completed_at - created_at).total_seconds() / 3600
+        for created_at, completed_at in tasks.filter(
+            status='completed', completed_at__gte=start, completed_at__lt=end
+        ).values_list('created_at', 'completed_at')
+    )
+    
+    def hours(value):
+        return round(value, 2) if value is not None else None
+    
+    return Response({
+        'start_date': start_date,
+        'end_date': end_date,
+        'domain': domain or '',
+        'series': series,
+        'cycle_time': {
+            'count': len(cycle_times),
+            'average_hours': hours(sum(cycle_times) / len(cycle_times)) if cycle_times else None,
+            'p50_hours': hours(percentile(cycle_times, 50)),
+            'p85_hours': hours(percentile(cycle_times, 85)),
+            'p95_hours': hours(percentile(cycle_times, 95)),
+        },
+    })
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Task, TaskComment, TaskHistory
+from .models import Task, TaskComment, TaskHistory, ArchivedTask
 
 
 @admin.register(Task)
@@ -14,6 +14,7 @@ class TaskAdmin(admin.ModelAdmin):
         (None, {'fields': ('title', 'description', 'priority', 'status')}),
         ('Assignment', {'fields': ('assigned_by', 'assigned_to', 'domain')}),
         ('Dates', {'fields': ('due_date', 'completed_at')}),
+        ('Recurrence', {'fields': ('recurrence', 'recurrence_interval', 'recurrence_end', 'recurrence_parent')}),
         ('Additional', {'fields': ('attachments', 'notes')}),
     )
 
@@ -31,4 +32,11 @@ class TaskHistoryAdmin(admin.ModelAdmin):
     list_display = ['task', 'user', 'action', 'timestamp']
     list_filter = ['action', 'timestamp']
     search_fields = ['task__title', 'user__username']
-    ordering = ['-timestamp'] 
\ No newline at end of file
+    ordering = ['-timestamp'] 
+
+@admin.register(ArchivedTask)
+class ArchivedTaskAdmin(admin.ModelAdmin):
+    list_display = ['title', 'assigned_to', 'domain', 'status', 'completed_at', 'archived_at']
+    list_filter = ['status', 'domain', 'archived_at']
+    search_fields = ['title', 'description', 'assigned_to__username']
+    ordering = ['-archived_at']
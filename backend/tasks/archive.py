@@ -0,0 +1,106 @@
+"""
+Hot/cold partitioning of finished tasks.
+
+Completed and cancelled tasks that finished more than N days ago are moved,
+together with their comments and history, into the ``*_archive`` tables so
+that the hot ``tasks`` table stays sized to the active workload. Recurring
+task templates are never archived since they anchor their series.
+
+Tasks touched within the last QUIET_PERIOD are left alone, so history rows
+that a worker's write-behind audit queue still holds for them can be written
+before the task leaves the hot table.
+"""
+from datetime import timedelta
+
+from django.db import connections, router, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .audit import audit_log
+
+from .models import (
+    Task, TaskComment, TaskHistory, ArchivedTask, ArchivedTaskComment, ArchivedTaskHistory
+)
+from .workload import invalidate_workload_cache
+
+CLOSED_STATUSES = ['completed', 'cancelled']
+
+QUIET_PERIOD = timedelta(hours=1)
+
+
+def archivable_tasks(days, now=None):
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=days)
+    return Task.objects.filter(
+        status__in=CLOSED_STATUSES, recurrence='', updated_at__lt=now - QUIET_PERIOD
+    ).filter(
+        Q(completed_at__lt=cutoff) | Q(completed_at__isnull=True, updated_at__lt=cutoff)
+    )
+
+
+def copy_rows(source, target_model, **extra):
+    """Build unsaved ``target_model`` rows with the same column values as ``source``"""
+    columns = [field.attname for field in target_model._meta.concrete_fields if field.attname not in extra]
+    return [
+        target_model(**{column: getattr(row, column) for column in columns}, **extra)
+        for row in source
+    ]
+
+
+def delete_rows(using, model, column, ids):
+    """
+    Plain ``DELETE ... WHERE column IN (ids)``. QuerySet.delete() would load
+    every comment and send per-row signals for tasks that are moving to the
+    archive anyway, and the rows have just been copied, so nothing needs to
+    cascade.
+    """
+    connection = connections[using]
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)} '
+            f'WHERE {connection.ops.quote_name(column)} IN ({placeholders})',
+            list(ids)
+        )
+
+
+def archive_batch(task_ids, archived_at):
+    using = router.db_for_write(Task)
+    with transaction.atomic(using=using):
+        tasks = Task.objects.filter(pk__in=task_ids)
+        comments = TaskComment.objects.filter(task_id__in=task_ids)
+        history = TaskHistory.objects.filter(task_id__in=task_ids)
+
+        ArchivedTask.objects.bulk_create(copy_rows(tasks, ArchivedTask, archived_at=archived_at))
+        ArchivedTaskComment.objects.bulk_create(copy_rows(comments, ArchivedTaskComment))
+        ArchivedTaskHistory.objects.bulk_create(copy_rows(history, ArchivedTaskHistory))
+
+        # Former templates may still be referenced by their occurrences
+        Task.objects.filter(recurrence_parent_id__in=task_ids).update(recurrence_parent=None)
+
+        delete_rows(using, TaskComment, 'task_id', task_ids)
+        delete_rows(using, TaskHistory, 'task_id', task_ids)
+        delete_rows(using, Task, 'id', task_ids)
+
+
+def archive_finished_tasks(days, batch_size=500, now=None):
+    """Move every archivable task into the archive tables; returns the number moved"""
+    archived_at = now or timezone.now()
+    moved = 0
+
+    # Write this process's queued history first, so none of it points at a
+    # task that is no longer in the hot table
+    audit_log.flush()
+
+    while True:
+        task_ids = list(
+            archivable_tasks(days, now=archived_at).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not task_ids:
+            break
+        archive_batch(task_ids, archived_at)
+        moved += len(task_ids)
+
+    if moved:
+        invalidate_workload_cache()
+    return moved
@@ -0,0 +1,81 @@
+"""
+Write-behind audit log for task field changes.
+
+History entries go through a WriteBehindQueue and are bulk-inserted by a
+background thread, so recording a change costs the request little more than
+a queue put.
+"""
+from datetime import date, datetime
+
+from django.conf import settings
+from django.db import models
+
+from clubManagement.writebehind import WriteBehindQueue
+
+from .models import TaskHistory
+
+# Task fields whose changes are recorded, and the history action used for each
+TRACKED_FIELDS = {
+    'status': 'status_changed',
+    'assigned_to': 'reassigned',
+    'priority': 'priority_changed',
+    'due_date': 'due_date_changed',
+    'domain': 'domain_changed',
+}
+
+
+def audit_value(value):
+    """Render a field value the way it is stored in TaskHistory"""
+    if value is None:
+        return None
+    if isinstance(value, models.Model):
+        return str(value.pk)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def comparable_value(value):
+    """Value used to decide whether a field changed; related objects compare by pk"""
+    if isinstance(value, models.Model):
+        return value.pk
+    return value
+
+
+def diff_task(task, changes, user):
+    """Build unsaved TaskHistory rows for every tracked field that changes"""
+    entries = []
+    for field, action in TRACKED_FIELDS.items():
+        if field not in changes:
+            continue
+        old_value = getattr(task, field)
+        new_value = changes[field]
+        if comparable_value(old_value) != comparable_value(new_value):
+            entries.append(TaskHistory(
+                task_id=task.pk,
+                user_id=user.pk,
+                action=action,
+                old_value=audit_value(old_value),
+                new_value=audit_value(new_value)
+            ))
+    return entries
+
+
+class AuditLogWriter(WriteBehindQueue):
+    thread_name = 'task-audit-writer'
+
+    def is_async(self):
+        return settings.TASK_AUDIT_ASYNC
+
+    def describe(self, entry):
+        return f'{entry.action} on task {entry.task_id} ({entry.old_value!r} -> {entry.new_value!r})'
+
+    def write(self, entries):
+        TaskHistory.objects.bulk_create(entries, batch_size=self.batch_size)
+
+
+audit_log = AuditLogWriter(
+    maxsize=settings.TASK_AUDIT_QUEUE_SIZE,
+    flush_interval=settings.TASK_AUDIT_FLUSH_INTERVAL,
+    batch_size=settings.TASK_AUDIT_BATCH_SIZE,
+)
@@ -0,0 +1,137 @@
+"""
+CSV import for tasks.
+
+Rows are read lazily and handled in chunks: assignees for the whole chunk are
+resolved with one query (and cached for later chunks), each row is validated,
+and the valid rows are inserted with bulk_create. Invalid rows are collected
+into a per-row error report instead of aborting the import.
+"""
+import csv
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Task, TaskHistory
+from .serializers import TaskBulkCreateItemSerializer
+from .workload import invalidate_workload_cache
+
+User = get_user_model()
+
+IMPORT_COLUMNS = ['title', 'description', 'priority', 'assigned_to', 'domain', 'due_date', 'notes']
+
+
+def insert_tasks(tasks, user, batch_size=500):
+    """Insert unsaved tasks and their 'created' history rows in one transaction"""
+    for task in tasks:
+        task.set_derived_fields()
+    with transaction.atomic():
+        tasks = Task.objects.bulk_create(tasks, batch_size=batch_size)
+        TaskHistory.objects.bulk_create(
+            [TaskHistory(task=task, user=user, action='created') for task in tasks],
+            batch_size=batch_size
+        )
+    invalidate_workload_cache()
+    return tasks
+
+
+def decode_lines(lines, encoding='utf-8-sig'):
+    """Decode an iterable of byte lines (e.g. an uploaded file) lazily"""
+    for line in lines:
+        yield line.decode(encoding) if isinstance(line, bytes) else line
+
+
+class TaskImporter:
+    def __init__(self, user, chunk_size=None, dry_run=False, max_errors=None):
+        self.user = user
+        self.chunk_size = chunk_size or settings.TASK_IMPORT_CHUNK_SIZE
+        self.dry_run = dry_run
+        self.max_errors = max_errors or settings.TASK_IMPORT_MAX_ERRORS
+        # username or email -> user id, or None if unknown
+        self._users = {}
+
+    def run(self, lines):
+        """Import tasks from CSV text lines and return the report"""
+        report = {'total_rows': 0, 'created': 0, 'error_count': 0, 'errors': [], 'errors_truncated': False}
+        reader = csv.DictReader(decode_lines(lines))
+
+        missing = [column for column in ('title', 'description') if column not in (reader.fieldnames or [])]
+        if missing:
+            report['error_count'] = 1
+            report['errors'].append({'row': 1, 'errors': {column: ['Missing column.'] for column in missing}})
+            return report
+
+        chunk = []
+        # Header is line 1, so data rows start at line 2
+        for line_number, row in enumerate(reader, start=2):
+            chunk.append((line_number, row))
+            if len(chunk) >= self.chunk_size:
+                self._import_chunk(chunk, report)
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk, report)
+
+        report['errors_truncated'] = report['error_count'] > len(report['errors'])
+        return report
+
+    def _import_chunk(self, chunk, report):
+        self._resolve_users(row.get('assigned_to') for _, row in chunk)
+
+        tasks = []
+        for line_number, row in chunk:
+            report['total_rows'] += 1
+            task, errors = self._build_task(row)
+            if errors:
+                report['error_count'] += 1
+                if len(report['errors']) < self.max_errors:
+                    report['errors'].append({'row': line_number, 'errors': errors})
+            else:
+                tasks.append(task)
+
+        if tasks and not self.dry_run:
+            insert_tasks(tasks, self.user, batch_size=self.chunk_size)
+        report['created'] += len(tasks)
+
+    def _resolve_users(self, identifiers):
+        """Look up every not-yet-cached username or email with a single query"""
+        pending = {identifier.strip() for identifier in identifiers if identifier and identifier.strip()}
+        pending -= set(self._users)
+        if not pending:
+            return
+
+        found = User.objects.filter(is_active=True).filter(
+            Q(username__in=pending) | Q(email__in=pending)
+        ).values_list('id', 'username', 'email')
+        for user_id, username, email in found:
+            for key in (username, email):
+                if key in pending:
+                    self._users[key] = user_id
+        for key in pending:
+            self._users.setdefault(key, None)
+
+    def _build_task(self, row):
+        data = {
+            column: (row.get(column) or '').strip()
+            for column in IMPORT_COLUMNS
+            if (row.get(column) or '').strip()
+        }
+
+        errors = {}
+        assignee = data.pop('assigned_to', None)
+        if assignee:
+            data['assigned_to'] = self._users.get(assignee)
+            if data['assigned_to'] is None:
+                errors['assigned_to'] = [f'No active user with username or email "{assignee}".']
+
+        serializer = TaskBulkCreateItemSerializer(data=data)
+        if not serializer.is_valid():
+            errors.update({field: [str(error) for error in messages] for field, messages in serializer.errors.items()})
+        if errors:
+            return None, errors
+
+        validated = dict(serializer.validated_data)
+        validated['assigned_to_id'] = validated.pop('assigned_to', None)
+        if self.user.is_junior_council:
+            validated['domain'] = self.user.domain
+        return Task(assigned_by=self.user, **validated), None
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.archive import archive_finished_tasks
+
+
+class Command(BaseCommand):
+    help = 'Move long-finished tasks with their comments and history into the archive tables (run periodically, e.g. from cron)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.TASK_ARCHIVE_AFTER_DAYS,
+            help='Archive completed/cancelled tasks finished more than this many days ago'
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Tasks moved per transaction')
+    
+    def handle(self, *args, **options):
+        moved = archive_finished_tasks(options['days'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {moved} tasks'))
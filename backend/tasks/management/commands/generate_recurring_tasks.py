@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.recurrence import generate_recurring_tasks
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming occurrences of recurring tasks within the lookahead window (run periodically, e.g. from cron)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lookahead-days',
+            type=int,
+            default=settings.TASK_RECURRENCE_LOOKAHEAD_DAYS,
+            help='How many days ahead to materialize occurrences'
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows inserted per batch')
+    
+    def handle(self, *args, **options):
+        scheduled = generate_recurring_tasks(
+            options['lookahead_days'],
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(self.style.SUCCESS(f'Created {scheduled} recurring task occurrences'))
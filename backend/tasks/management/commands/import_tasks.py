@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.importer import TaskImporter
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Create tasks in bulk from a CSV file (columns: title, description, priority, assigned_to, domain, due_date, notes)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', help='Path to the CSV file')
+        parser.add_argument(
+            '--assigned-by',
+            required=True,
+            help='Username of the user recorded as creator of the tasks'
+        )
+        parser.add_argument('--chunk-size', type=int, default=None, help='Rows validated and inserted per batch')
+        parser.add_argument('--dry-run', action='store_true', help='Validate the file without creating tasks')
+    
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['assigned_by'])
+        except User.DoesNotExist:
+            raise CommandError(f"User \"{options['assigned_by']}\" does not exist")
+        
+        importer = TaskImporter(user, chunk_size=options['chunk_size'], dry_run=options['dry_run'])
+        try:
+            with open(options['csv_file'], newline='', encoding='utf-8-sig') as csv_file:
+                report = importer.run(csv_file)
+        except OSError as e:
+            raise CommandError(str(e))
+        
+        for error in report['errors']:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        if report['errors_truncated']:
+            self.stderr.write(f"... {report['error_count'] - len(report['errors'])} more rows with errors")
+        
+        verb = 'Validated' if options['dry_run'] else 'Created'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {report['created']} of {report['total_rows']} tasks ({report['error_count']} rows with errors)"
+        ))
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:09
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_alter_task_domain'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='taskhistory',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:09
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def flag_overdue_tasks(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    Task.objects.filter(
+        status__in=['pending', 'in_progress'],
+        due_date__lt=timezone.now()
+    ).update(overdue=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_history_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='overdue',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'in_progress'])), fields=['due_date'], name='tasks_open_due_date_idx'),
+        ),
+        migrations.RunPython(flag_overdue_tasks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.db import BaseDatabaseCache
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_tables(apps, schema_editor):
+    """
+    The shared cache lives in the database (settings.CACHES); create its table
+    here so ``migrate`` is the only setup step. Existing tables are left alone.
+    """
+    call_command('createcachetable', database=schema_editor.connection.alias, verbosity=0)
+
+
+def remove_cache_tables(apps, schema_editor):
+    for alias in settings.CACHES:
+        cache = caches[alias]
+        if isinstance(cache, BaseDatabaseCache):
+            schema_editor.execute(
+                'DROP TABLE IF EXISTS %s' % schema_editor.quote_name(cache._table)
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_task_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_tables, remove_cache_tables),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:59
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_cache_table'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='task',
+            name='overdue',
+        ),
+    ]
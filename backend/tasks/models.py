@@ -1,6 +1,13 @@
 from django.db import models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.core.validators import MinValueValidator
 from django.contrib.auth import get_user_model
 from django.conf import settings
+from django.utils import timezone
+
+from clubManagement.signals import deleting_parent
 
 User = get_user_model()
 
@@ -20,6 +27,14 @@ class Task(models.Model):
         ('cancelled', 'Cancelled'),
     ]
     
+    OPEN_STATUSES = ['pending', 'in_progress']
+    
+    RECURRENCE_CHOICES = [
+        ('daily', 'Daily'),
+        ('weekly', 'Weekly'),
+        ('monthly', 'Monthly'),
+    ]
+    
     title = models.CharField(max_length=200)
     description = models.TextField()
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default='medium')
@@ -50,6 +65,24 @@ class Task(models.Model):
     due_date = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
+    # Recurrence: a task with a rule is the template for later occurrences,
+    # which the generate_recurring_tasks command creates ahead of time
+    recurrence = models.CharField(max_length=10, choices=RECURRENCE_CHOICES, blank=True)
+    recurrence_interval = models.PositiveSmallIntegerField(default=1, validators=[MinValueValidator(1)])
+    recurrence_end = models.DateTimeField(null=True, blank=True)
+    recurrence_generated_until = models.DateTimeField(null=True, blank=True)
+    recurrence_parent = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        related_name='occurrences',
+        null=True,
+        blank=True
+    )
+    
+    # Denormalized comment activity, maintained by the TaskComment signals below
+    comment_count = models.PositiveIntegerField(default=0)
+    last_comment_at = models.DateTimeField(null=True, blank=True)
+    
     # Additional fields
     attachments = models.FileField(upload_to='task_attachments/', blank=True, null=True)
     notes = models.TextField(blank=True)
@@ -57,21 +90,45 @@ class Task(models.Model):
     class Meta:
         db_table = 'tasks'
         ordering = ['-created_at']
+        indexes = [
+            # Open tasks by deadline, for overdue counts and due-soon buckets
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(status__in=['pending', 'in_progress']),
+                name='tasks_open_due_date_idx'
+            ),
+        ]
+        constraints = [
+            # Makes occurrence generation idempotent
+            models.UniqueConstraint(
+                fields=['recurrence_parent', 'due_date'],
+                condition=models.Q(recurrence_parent__isnull=False),
+                name='tasks_unique_occurrence'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.get_status_display()}"
     
+    def set_derived_fields(self, now=None):
+        """
+        Bring completed_at in line with the status, for bulk paths that
+        bypass the serializers
+        """
+        if self.status == 'completed':
+            self.completed_at = self.completed_at or now or timezone.now()
+        else:
+            self.completed_at = None
+    
     @property
     def is_overdue(self):
         if self.due_date and self.status not in ['completed', 'cancelled']:
-            from django.utils import timezone
             return timezone.now() > self.due_date
         return False
     
     @property
     def days_remaining(self):
         if self.due_date and self.status not in ['completed', 'cancelled']:
-            from django.utils import timezone
             delta = self.due_date - timezone.now()
             return delta.days
         return None
@@ -98,11 +155,106 @@ class TaskHistory(models.Model):
     action = models.CharField(max_length=50)  # e.g., 'created', 'updated', 'status_changed'
     old_value = models.CharField(max_length=200, blank=True, null=True)
     new_value = models.CharField(max_length=200, blank=True, null=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: entries written behind the request keep the time of the change
+    timestamp = models.DateTimeField(default=timezone.now)
     
     class Meta:
         db_table = 'task_history'
         ordering = ['-timestamp']
     
     def __str__(self):
-        return f"{self.action} on {self.task.title} by {self.user.username}" 
\ No newline at end of file
+        return f"{self.action} on {self.task.title} by {self.user.username}"
+
+
+class ArchivedTask(models.Model):
+    """
+    Cold storage for tasks that finished long ago, moved out of ``tasks`` by
+    the archive_tasks command. Rows keep their original ids.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    priority = models.CharField(max_length=10, choices=Task.PRIORITY_CHOICES)
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES)
+    assigned_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+', null=True, blank=True)
+    assigned_to = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+', null=True, blank=True)
+    domain = models.CharField(max_length=20, choices=User.DOMAIN_CHOICES, blank=True, null=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    due_date = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    recurrence = models.CharField(max_length=10, choices=Task.RECURRENCE_CHOICES, blank=True)
+    recurrence_parent_id = models.BigIntegerField(null=True, blank=True)
+    comment_count = models.PositiveIntegerField(default=0)
+    last_comment_at = models.DateTimeField(null=True, blank=True)
+    attachments = models.FileField(upload_to='task_attachments/', blank=True, null=True)
+    notes = models.TextField(blank=True)
+    archived_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        db_table = 'tasks_archive'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.title} - {self.get_status_display()} (archived)"
+    
+    # Archived tasks are always finished
+    is_overdue = False
+    days_remaining = None
+
+
+class ArchivedTaskComment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(ArchivedTask, on_delete=models.CASCADE, related_name='comments')
+    author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    content = models.TextField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'task_comments_archive'
+        ordering = ['created_at']
+
+
+class ArchivedTaskHistory(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(ArchivedTask, on_delete=models.CASCADE, related_name='history')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    action = models.CharField(max_length=50)
+    old_value = models.CharField(max_length=200, blank=True, null=True)
+    new_value = models.CharField(max_length=200, blank=True, null=True)
+    timestamp = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'task_history_archive'
+        ordering = ['-timestamp']
+
+
+@receiver(post_save, sender=TaskComment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    """Bump the task's comment counters in a single UPDATE"""
+    if created:
+        Task.objects.filter(pk=instance.task_id).update(
+            comment_count=F('comment_count') + 1,
+            last_comment_at=instance.created_at
+        )
+
+
+@receiver(post_delete, sender=TaskComment)
+def decrement_comment_count(sender, instance, origin=None, **kwargs):
+    """Drop the task's comment count and fall back to its newest remaining comment"""
+    if deleting_parent(origin, Task):
+        return
+    latest = TaskComment.objects.filter(task=OuterRef('pk')).order_by('-created_at').values('created_at')[:1]
+    Task.objects.filter(pk=instance.task_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1,
+        last_comment_at=Subquery(latest)
+    )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_caches(sender, **kwargs):
+    """Cached aggregates over tasks go stale on every task write"""
+    from .workload import invalidate_workload_cache
+    invalidate_workload_cache()
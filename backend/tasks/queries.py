@@ -0,0 +1,45 @@
+"""
+Task queryset helpers shared by the task views and other apps' reports.
+"""
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Task
+
+
+def overdue_q(now=None, prefix=''):
+    """
+    Open tasks past their due date, evaluated at query time. Served by the
+    partial index on open tasks' due_date.
+    """
+    return Q(**{
+        f'{prefix}status__in': Task.OPEN_STATUSES,
+        f'{prefix}due_date__lt': now or timezone.now(),
+    })
+
+
+def get_visible_tasks(user, queryset=None):
+    """Restrict a task queryset to what the given user is allowed to see"""
+    if queryset is None:
+        queryset = Task.objects.all()
+    
+    if user.is_admin or user.is_senior_council:
+        return queryset
+    elif user.is_junior_council:
+        if user.domain:
+            return queryset.filter(
+                Q(domain=user.domain) | Q(assigned_by=user)
+            )
+        return queryset.filter(
+            Q(assigned_by=user) | Q(assigned_to=user)
+        )
+    else:
+        if user.domain:
+            return queryset.filter(
+                Q(assigned_to=user) | 
+                Q(domain=user.domain, assigned_to__isnull=True) |
+                Q(assigned_by=user)
+            )
+        return queryset.filter(
+            Q(assigned_to=user) | Q(assigned_by=user)
+        )
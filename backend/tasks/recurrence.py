@@ -0,0 +1,148 @@
+"""
+Materialization of recurring tasks.
+
+A task with a ``recurrence`` rule acts as the template for its series; its
+``due_date`` is the first occurrence. Later occurrences are created ahead of
+time, up to a lookahead window, by the generate_recurring_tasks command and
+never lazily while serving requests. ``recurrence_generated_until`` records
+how far each series has been materialized, and the unique constraint on
+(recurrence_parent, due_date) makes re-runs harmless.
+"""
+import calendar
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task, TaskHistory
+from .workload import invalidate_workload_cache
+
+
+def add_months(value, months):
+    """Shift a datetime by whole months, clamping the day to the month's length"""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def occurrence_at(template, index):
+    """Due date of the ``index``-th occurrence (0 is the template itself)"""
+    step = index * max(template.recurrence_interval, 1)
+    if template.recurrence == 'daily':
+        return template.due_date + timedelta(days=step)
+    if template.recurrence == 'weekly':
+        return template.due_date + timedelta(weeks=step)
+    return add_months(template.due_date, step)
+
+
+def upcoming_occurrences(template, now, until):
+    """
+    Due dates after both ``now`` and the series' high-water mark, up to and
+    including ``until``. Occurrences already in the past are never backfilled.
+    """
+    start = max(template.recurrence_generated_until or template.due_date, now)
+    end = min(until, template.recurrence_end) if template.recurrence_end else until
+
+    index = 1
+    while True:
+        due_date = occurrence_at(template, index)
+        if due_date > end:
+            break
+        if due_date > start:
+            yield due_date
+        index += 1
+
+
+def build_occurrence(template, due_date):
+    occurrence = Task(
+        title=template.title,
+        description=template.description,
+        priority=template.priority,
+        assigned_by_id=template.assigned_by_id,
+        assigned_to_id=template.assigned_to_id,
+        domain=template.domain,
+        notes=template.notes,
+        due_date=due_date,
+        recurrence_parent=template,
+    )
+    occurrence.set_derived_fields()
+    return occurrence
+
+
+def insert_created_history(occurrences, inserted_at, batch_size=500):
+    """
+    Write the 'created' history entries for the occurrences a conflict-ignoring
+    bulk_create actually inserted, found again by (recurrence_parent, due_date)
+    since bulk_create cannot report which rows were skipped. Returns how many
+    were inserted.
+    """
+    keys = {(occurrence.recurrence_parent_id, occurrence.due_date) for occurrence in occurrences}
+    if not keys:
+        return 0
+    inserted = [
+        task for task in Task.objects.filter(
+            recurrence_parent_id__in={parent_id for parent_id, _ in keys},
+            due_date__in={due_date for _, due_date in keys},
+            created_at__gte=inserted_at,
+        ).exclude(history__action='created').only('pk', 'recurrence_parent_id', 'due_date', 'assigned_by_id')
+        if (task.recurrence_parent_id, task.due_date) in keys
+    ]
+    TaskHistory.objects.bulk_create(
+        [
+            TaskHistory(task=task, user_id=task.assigned_by_id, action='created')
+            for task in inserted if task.assigned_by_id is not None
+        ],
+        batch_size=batch_size
+    )
+    return len(inserted)
+
+
+def generate_recurring_tasks(lookahead_days, now=None, batch_size=500):
+    """
+    Create every missing occurrence due within ``lookahead_days``, with a
+    'created' history entry each, and return the number of occurrences created.
+    """
+    now = now or timezone.now()
+    until = now + timedelta(days=lookahead_days)
+
+    templates = Task.objects.filter(due_date__isnull=False).exclude(recurrence='').exclude(
+        status='cancelled'
+    ).exclude(
+        recurrence_generated_until__gte=until
+    ).exclude(
+        recurrence_end__lte=F('recurrence_generated_until')
+    ).order_by('pk')
+
+    scheduled = 0
+    occurrences = []
+    advanced = []
+
+    def flush():
+        with transaction.atomic():
+            inserted_at = timezone.now()
+            Task.objects.bulk_create(occurrences, batch_size=batch_size, ignore_conflicts=True)
+            created = insert_created_history(occurrences, inserted_at, batch_size)
+            Task.objects.bulk_update(advanced, ['recurrence_generated_until'], batch_size=batch_size)
+        occurrences.clear()
+        advanced.clear()
+        return created
+
+    for template in templates.iterator(chunk_size=batch_size):
+        for due_date in upcoming_occurrences(template, now, until):
+            occurrences.append(build_occurrence(template, due_date))
+
+        template.recurrence_generated_until = until
+        advanced.append(template)
+
+        if len(occurrences) >= batch_size or len(advanced) >= batch_size:
+            scheduled += flush()
+
+    if advanced:
+        scheduled += flush()
+    if scheduled:
+        invalidate_workload_cache()
+
+    return scheduled
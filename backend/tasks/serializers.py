@@ -1,6 +1,8 @@
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from .models import Task, TaskComment, TaskHistory
+from .audit import audit_log, diff_task
 
 User = get_user_model()
 
@@ -30,10 +32,19 @@ class TaskHistorySerializer(serializers.ModelSerializer):
 
 
 class TaskSerializer(serializers.ModelSerializer):
+    """
+    Task detail with only the latest comments and history embedded.
+
+    The full lists are served by the cursor-paginated comment and history
+    endpoints; ``comments_total`` and ``history_total`` tell the client
+    whether there is more to fetch.
+    """
     assigned_by = UserSerializer(read_only=True)
     assigned_to = UserSerializer(read_only=True)
-    comments = TaskCommentSerializer(many=True, read_only=True)
-    history = TaskHistorySerializer(many=True, read_only=True)
+    comments = serializers.SerializerMethodField()
+    history = serializers.SerializerMethodField()
+    comments_total = serializers.SerializerMethodField()
+    history_total = serializers.SerializerMethodField()
     is_overdue = serializers.ReadOnlyField()
     days_remaining = serializers.ReadOnlyField()
     
@@ -42,18 +53,51 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'priority', 'status', 'assigned_by', 
             'assigned_to', 'domain', 'created_at', 'updated_at', 'due_date', 
-            'completed_at', 'attachments', 'notes', 'comments', 'history',
-            'is_overdue', 'days_remaining'
+            'completed_at', 'attachments', 'notes', 'recurrence', 'recurrence_interval',
+            'recurrence_end', 'recurrence_parent', 'comments', 'history',
+            'comments_total', 'history_total', 'is_overdue', 'days_remaining'
         ]
-        read_only_fields = ['assigned_by', 'created_at', 'updated_at', 'completed_at']
+        read_only_fields = ['assigned_by', 'created_at', 'updated_at', 'completed_at', 'recurrence_parent']
+    
+    def get_comments(self, obj):
+        # Prefetched newest-first by TaskDetailView; shown oldest-first
+        comments = getattr(obj, 'recent_comments', None)
+        if comments is None:
+            comments = obj.comments.select_related('author').order_by('-created_at')[:settings.TASK_DETAIL_EMBED_LIMIT]
+        return TaskCommentSerializer(list(comments)[::-1], many=True).data
+    
+    def get_history(self, obj):
+        history = getattr(obj, 'recent_history', None)
+        if history is None:
+            history = obj.history.select_related('user').order_by('-timestamp')[:settings.TASK_DETAIL_EMBED_LIMIT]
+        return TaskHistorySerializer(history, many=True).data
+    
+    def get_comments_total(self, obj):
+        return obj.comment_count
+    
+    def get_history_total(self, obj):
+        total = getattr(obj, 'history_total', None)
+        return total if total is not None else obj.history.count()
+
 
+class RecurrenceValidationMixin:
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        instance = getattr(self, 'instance', None)
+        recurrence = attrs.get('recurrence', getattr(instance, 'recurrence', ''))
+        due_date = attrs.get('due_date', getattr(instance, 'due_date', None))
+        if recurrence and not due_date:
+            raise serializers.ValidationError({'due_date': 'Recurring tasks need a due date to anchor the series.'})
+        return attrs
 
-class TaskCreateSerializer(serializers.ModelSerializer):
+
+class TaskCreateSerializer(RecurrenceValidationMixin, serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = [
             'title', 'description', 'priority', 'assigned_to', 'domain', 
-            'due_date', 'attachments', 'notes'
+            'due_date', 'attachments', 'notes', 'recurrence', 'recurrence_interval',
+            'recurrence_end'
         ]
     
     def create(self, validated_data):
@@ -61,31 +105,33 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class TaskUpdateSerializer(serializers.ModelSerializer):
+class TaskUpdateSerializer(RecurrenceValidationMixin, serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = [
             'title', 'description', 'priority', 'status', 'assigned_to', 
-            'domain', 'due_date', 'attachments', 'notes'
+            'domain', 'due_date', 'attachments', 'notes', 'recurrence',
+            'recurrence_interval', 'recurrence_end'
         ]
     
     def update(self, instance, validated_data):
-        # Record status change in history
-        if 'status' in validated_data and validated_data['status'] != instance.status:
-            TaskHistory.objects.create(
-                task=instance,
-                user=self.context['request'].user,
-                action='status_changed',
-                old_value=instance.status,
-                new_value=validated_data['status']
-            )
-            
-            # Set completed_at if status is completed
-            if validated_data['status'] == 'completed':
-                from django.utils import timezone
-                validated_data['completed_at'] = timezone.now()
+        # Record field-level changes in history off the request path
+        entries = diff_task(instance, validated_data, self.context['request'].user)
+        
+        # Set completed_at if status is completed, and clear it when reopened
+        if validated_data.get('status') == 'completed' and instance.status != 'completed':
+            from django.utils import timezone
+            validated_data['completed_at'] = timezone.now()
+        elif 'status' in validated_data and validated_data['status'] != 'completed':
+            validated_data['completed_at'] = None
         
-        return super().update(instance, validated_data)
+        # Save only the submitted fields: the comment counters are changed
+        # concurrently by F() updates and a full save would overwrite them
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        audit_log.record(entries)
+        return instance
 
 
 class TaskListSerializer(serializers.ModelSerializer):
@@ -98,7 +144,8 @@ class TaskListSerializer(serializers.ModelSerializer):
         model = Task
         fields = [
             'id', 'title', 'priority', 'status', 'assigned_by', 'assigned_to',
-            'domain', 'created_at', 'due_date', 'is_overdue', 'days_remaining'
+            'domain', 'created_at', 'due_date', 'recurrence', 'comment_count',
+            'last_comment_at', 'is_overdue', 'days_remaining'
         ]
         read_only_fields = ['assigned_by', 'created_at']
 
@@ -111,4 +158,55 @@ class TaskFilterSerializer(serializers.Serializer):
     assigned_by = serializers.IntegerField(required=False)
     due_date_from = serializers.DateTimeField(required=False)
     due_date_to = serializers.DateTimeField(required=False)
-    search = serializers.CharField(required=False) 
\ No newline at end of file
+    overdue = serializers.BooleanField(required=False, allow_null=True, default=None)
+    include_archived = serializers.BooleanField(required=False, default=False)
+    search = serializers.CharField(required=False) 
+
+class TaskBulkCreateItemSerializer(serializers.ModelSerializer):
+    # Resolved against a single user lookup for the whole batch
+    assigned_to = serializers.IntegerField(required=False, allow_null=True)
+    
+    class Meta:
+        model = Task
+        fields = [
+            'title', 'description', 'priority', 'assigned_to', 'domain', 
+            'due_date', 'notes'
+        ]
+
+
+class TaskBulkSerializer(serializers.Serializer):
+    ACTION_CHOICES = [
+        ('create', 'Create'),
+        ('update_status', 'Update Status'),
+        ('reassign', 'Reassign'),
+        ('delete', 'Delete'),
+    ]
+    
+    action = serializers.ChoiceField(choices=ACTION_CHOICES)
+    tasks = serializers.ListField(
+        child=serializers.DictField(), required=False,
+        allow_empty=False, max_length=settings.TASK_BULK_MAX_ITEMS
+    )
+    task_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False,
+        allow_empty=False, max_length=settings.TASK_BULK_MAX_ITEMS
+    )
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    assigned_to = serializers.IntegerField(required=False, allow_null=True)
+    
+    def validate(self, attrs):
+        action = attrs['action']
+        if action == 'create':
+            if 'tasks' not in attrs:
+                raise serializers.ValidationError({'tasks': 'This field is required for create.'})
+        elif 'task_ids' not in attrs:
+            raise serializers.ValidationError({'task_ids': f'This field is required for {action}.'})
+        
+        if action == 'update_status' and 'status' not in attrs:
+            raise serializers.ValidationError({'status': 'This field is required for update_status.'})
+        if action == 'reassign' and 'assigned_to' not in attrs:
+            raise serializers.ValidationError({'assigned_to': 'This field is required for reassign.'})
+        
+        if 'task_ids' in attrs:
+            attrs['task_ids'] = list(dict.fromkeys(attrs['task_ids']))
+        return attrs
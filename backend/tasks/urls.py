@@ -1,21 +1,31 @@
 from django.urls import path
 from .views import (
-    TaskListView, TaskDetailView, TaskCommentView, TaskCommentDetailView,
-    task_statistics, my_tasks, team_tasks, recent_tasks
+    TaskListView, TaskExportView, TaskBoardView, TaskDetailView, TaskCommentView, TaskCommentDetailView, TaskHistoryView,
+    task_statistics, my_tasks, team_tasks, recent_tasks, bulk_tasks,
+    due_soon_tasks, import_tasks, task_workload
 )
 
 urlpatterns = [
     # Task management
     path('', TaskListView.as_view(), name='task_list'),
     path('<int:pk>/', TaskDetailView.as_view(), name='task_detail'),
+    path('bulk/', bulk_tasks, name='task_bulk'),
+    path('export/', TaskExportView.as_view(), name='task_export'),
+    path('board/', TaskBoardView.as_view(), name='task_board'),
+    path('import/', import_tasks, name='task_import'),
     
     # Task comments
     path('<int:task_id>/comments/', TaskCommentView.as_view(), name='task_comments'),
     path('comments/<int:pk>/', TaskCommentDetailView.as_view(), name='task_comment_detail'),
     
+    # Task history
+    path('<int:task_id>/history/', TaskHistoryView.as_view(), name='task_history'),
+    
     # Task statistics and filters
     path('statistics/', task_statistics, name='task_statistics'),
     path('my-tasks/', my_tasks, name='my_tasks'),
     path('team-tasks/', team_tasks, name='team_tasks'),
     path('recent/', recent_tasks, name='recent_tasks'),
+    path('due-soon/', due_soon_tasks, name='due_soon_tasks'),
+    path('workload/', task_workload, name='task_workload'),
 ] 
\ No newline at end of file
@@ -1,19 +1,58 @@
+import csv
+from itertools import chain
 from rest_framework import generics, status, filters
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.db.models import Q
+from rest_framework.pagination import CursorPagination
+from rest_framework.renderers import JSONRenderer
+from django.conf import settings
+from django.db.models import (
+    Q, F, Count, OuterRef, Prefetch, Subquery, Value, Window, BooleanField, ExpressionWrapper
+)
+from django.db.models.functions import Coalesce, RowNumber
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import timedelta
-from .models import Task, TaskComment, TaskHistory
+from clubManagement.streaming import (
+    StreamingJSONResponse, serialize_queryset, get_chunk_size,
+    iter_csv, iter_ndjson, CSVRenderer, NDJSONRenderer
+)
+from .models import Task, TaskComment, TaskHistory, ArchivedTask
+from .queries import get_visible_tasks, overdue_q
+from .importer import TaskImporter, insert_tasks
+from .workload import get_domain_workload, invalidate_workload_cache
 from .serializers import (
     TaskSerializer, TaskCreateSerializer, TaskUpdateSerializer, TaskListSerializer,
-    TaskCommentSerializer, TaskFilterSerializer
+    TaskCommentSerializer, TaskHistorySerializer, TaskFilterSerializer,
+    TaskBulkSerializer, TaskBulkCreateItemSerializer
 )
 from users.permissions import (
     CanViewAllTasks, CanCreateTasks, CanEditTasks, CanDeleteTasks
 )
 
+User = get_user_model()
+
+
+def _related_count(model):
+    """Correlated COUNT subquery over a model with a ``task`` foreign key"""
+    counts = model.objects.filter(task=OuterRef('pk')).order_by().values('task').annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts), Value(0))
+
+
+class TaskCommentPagination(CursorPagination):
+    page_size = 20
+    ordering = '-created_at'
+
+
+class TaskHistoryPagination(CursorPagination):
+    page_size = 20
+    ordering = '-timestamp'
+
 
 class TaskListView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
@@ -27,68 +66,90 @@ class TaskListView(generics.ListCreateAPIView):
             return TaskCreateSerializer
         return TaskListSerializer
     
+    def get_filters(self):
+        filters = TaskFilterSerializer(data=self.request.query_params)
+        return filters.validated_data if filters.is_valid() else {}
+    
+    def apply_filters(self, queryset):
+        """Apply the query-string filters; shared by the hot and archived tables"""
+        params = self.get_filters()
+        if params.get('status'):
+            queryset = queryset.filter(status=params['status'])
+        if params.get('priority'):
+            queryset = queryset.filter(priority=params['priority'])
+        if params.get('domain'):
+            queryset = queryset.filter(domain=params['domain'])
+        if params.get('assigned_to'):
+            queryset = queryset.filter(assigned_to_id=params['assigned_to'])
+        if params.get('assigned_by'):
+            queryset = queryset.filter(assigned_by_id=params['assigned_by'])
+        if params.get('due_date_from'):
+            queryset = queryset.filter(due_date__gte=params['due_date_from'])
+        if params.get('due_date_to'):
+            queryset = queryset.filter(due_date__lte=params['due_date_to'])
+        if params.get('overdue') is not None:
+            if queryset.model is ArchivedTask:
+                # Archived tasks are finished, so never overdue
+                queryset = queryset.none() if params['overdue'] else queryset
+            else:
+                overdue = overdue_q()
+                queryset = queryset.filter(overdue if params['overdue'] else ~overdue)
+        if params.get('search'):
+            search = params['search']
+            queryset = queryset.filter(
+                Q(title__icontains=search) | 
+                Q(description__icontains=search)
+            )
+        return queryset
+    
     def get_queryset(self):
-        user = self.request.user
-        queryset = Task.objects.all()
+        # Apply role-based filtering, then the query-string filters
+        return self.apply_filters(get_visible_tasks(self.request.user))
+    
+    def get_archived_queryset(self):
+        return self.apply_filters(
+            get_visible_tasks(self.request.user, ArchivedTask.objects.all())
+        )
+    
+    def include_archived(self):
+        return bool(self.get_filters().get('include_archived'))
+    
+    def list(self, request, *args, **kwargs):
+        if not self.include_archived():
+            return super().list(request, *args, **kwargs)
         
-        # Apply role-based filtering
-        if user.is_admin:
-            # Admin can see all tasks
-            pass
-        elif user.is_senior_council:
-            # Senior council can see tasks from all domains
-            pass
-        elif user.is_junior_council:
-            # Junior council can see tasks in their domain or tasks they created
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(domain=user.domain) | Q(assigned_by=user)
-                )
-            else:
-                # If no domain, show tasks they created or are assigned to them
-                queryset = queryset.filter(
-                    Q(assigned_by=user) | Q(assigned_to=user)
-                )
-        else:
-            # Board members can see tasks assigned to them or tasks in their domain
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(assigned_to=user) | 
-                    Q(domain=user.domain, assigned_to__isnull=True) |
-                    Q(assigned_by=user)
-                )
-            else:
-                # If no domain, show tasks assigned to them or tasks they created
-                queryset = queryset.filter(
-                    Q(assigned_to=user) | Q(assigned_by=user)
-                )
+        # Page over the union of both tables using only the ordering columns,
+        # then load full rows for the page alone
+        columns = ['id', 'created_at', 'due_date', 'priority', 'status']
+        hot = self.filter_queryset(self.get_queryset()).order_by().values(
+            *columns, archived=Value(False)
+        )
+        cold = self.filter_queryset(self.get_archived_queryset()).order_by().values(
+            *columns, archived=Value(True)
+        )
+        ordering = filters.OrderingFilter().get_ordering(request, hot, self) or self.ordering
+        rows = hot.union(cold, all=True).order_by(*ordering, '-id')
         
-        # Apply filters
-        filters = TaskFilterSerializer(data=self.request.query_params)
-        if filters.is_valid():
-            if filters.validated_data.get('status'):
-                queryset = queryset.filter(status=filters.validated_data['status'])
-            if filters.validated_data.get('priority'):
-                queryset = queryset.filter(priority=filters.validated_data['priority'])
-            if filters.validated_data.get('domain'):
-                queryset = queryset.filter(domain=filters.validated_data['domain'])
-            if filters.validated_data.get('assigned_to'):
-                queryset = queryset.filter(assigned_to_id=filters.validated_data['assigned_to'])
-            if filters.validated_data.get('assigned_by'):
-                queryset = queryset.filter(assigned_by_id=filters.validated_data['assigned_by'])
-            if filters.validated_data.get('due_date_from'):
-                queryset = queryset.filter(due_date__gte=filters.validated_data['due_date_from'])
-            if filters.validated_data.get('due_date_to'):
-                queryset = queryset.filter(due_date__lte=filters.validated_data['due_date_to'])
-            if filters.validated_data.get('search'):
-                search = filters.validated_data['search']
-                queryset = queryset.filter(
-                    Q(title__icontains=search) | 
-                    Q(description__icontains=search)
-                )
+        page = self.paginate_queryset(rows)
+        page_rows = list(rows) if page is None else page
         
-        return queryset
-
+        hot_tasks = Task.objects.select_related('assigned_by', 'assigned_to').in_bulk(
+            [row['id'] for row in page_rows if not row['archived']]
+        )
+        cold_tasks = ArchivedTask.objects.select_related('assigned_by', 'assigned_to').in_bulk(
+            [row['id'] for row in page_rows if row['archived']]
+        )
+        
+        data = []
+        for row in page_rows:
+            task = (cold_tasks if row['archived'] else hot_tasks).get(row['id'])
+            if task is not None:
+                data.append({**TaskListSerializer(task).data, 'archived': row['archived']})
+        
+        if page is None:
+            return Response(data)
+        return self.get_paginated_response(data)
+    
     def perform_create(self, serializer):
         """Override to enforce domain restrictions for Junior Council"""
         user = self.request.user
@@ -107,41 +168,134 @@ class TaskListView(generics.ListCreateAPIView):
         return task
 
 
+class TaskExportView(TaskListView):
+    """
+    Stream every task matching the task list's scope and filters as CSV or
+    NDJSON, reading the database in chunks so memory use stays constant.
+    """
+    http_method_names = ['get', 'head', 'options']
+    renderer_classes = [JSONRenderer, CSVRenderer, NDJSONRenderer]
+    
+    EXPORT_FIELDS = [
+        ('id', 'id'),
+        ('title', 'title'),
+        ('status', 'status'),
+        ('priority', 'priority'),
+        ('domain', 'domain'),
+        ('assigned_to', 'assigned_to__username'),
+        ('assigned_by', 'assigned_by__username'),
+        ('created_at', 'created_at'),
+        ('due_date', 'due_date'),
+        ('completed_at', 'completed_at'),
+        # Computed at export time, like the ?overdue= filter
+        ('overdue', 'overdue_now'),
+    ]
+    
+    def perform_content_negotiation(self, request, force=False):
+        # The negotiator answers an unknown ?format= with a 404 before get()
+        # runs; fall back to JSON so get() can reject it with a 400 instead
+        return super().perform_content_negotiation(request, force=True)
+    
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get('format', 'csv')
+        if export_format not in ('csv', 'ndjson'):
+            return Response(
+                {'error': 'format must be csv or ndjson'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        columns = [column for column, _ in self.EXPORT_FIELDS]
+        lookups = [lookup for _, lookup in self.EXPORT_FIELDS]
+        
+        overdue_now = ExpressionWrapper(overdue_q(timezone.now()), output_field=BooleanField())
+        
+        # values_list joins the assignees in the same query, like select_related,
+        # without building a model instance per row
+        rows = self.filter_queryset(self.get_queryset()).annotate(
+            overdue_now=overdue_now
+        ).values_list(*lookups).iterator(chunk_size=get_chunk_size())
+        
+        if self.include_archived():
+            columns.append('archived')
+            archived_rows = self.filter_queryset(self.get_archived_queryset()).annotate(
+                overdue_now=overdue_now
+            ).values_list(*lookups, Value(True)).iterator(chunk_size=get_chunk_size())
+            rows = chain((row + (False,) for row in rows), archived_rows)
+        
+        filename = f"tasks-{timezone.now():%Y%m%d}.{export_format}"
+        if export_format == 'csv':
+            content = iter_csv(columns, rows)
+            content_type = 'text/csv'
+        else:
+            content = iter_ndjson(dict(zip(columns, row)) for row in rows)
+            content_type = 'application/x-ndjson'
+        
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class TaskBoardView(TaskListView):
+    """
+    Kanban snapshot: the first ``limit`` tasks of every status column plus
+    each column's total, fetched with a single windowed query under the same
+    visibility scope and filters as the task list.
+    """
+    http_method_names = ['get', 'head', 'options']
+    
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 100)
+        except ValueError:
+            limit = 10
+        
+        tasks = self.get_queryset().select_related('assigned_by', 'assigned_to').annotate(
+            column_rank=Window(
+                RowNumber(),
+                partition_by=F('status'),
+                order_by=[F('created_at').desc(), F('id').desc()]
+            ),
+            column_total=Window(Count('pk'), partition_by=F('status')),
+        ).filter(column_rank__lte=limit).order_by('status', 'column_rank')
+        
+        columns = {
+            code: {'status': code, 'label': label, 'total': 0, 'tasks': []}
+            for code, label in Task.STATUS_CHOICES
+        }
+        for task in tasks:
+            column = columns[task.status]
+            column['total'] = task.column_total
+            column['tasks'].append(TaskListSerializer(task).data)
+        
+        return Response({'limit': limit, 'columns': list(columns.values())})
+
+
 class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = TaskSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        queryset = Task.objects.all()
+        queryset = get_visible_tasks(self.request.user)
         
-        # Apply role-based filtering
-        if user.is_admin:
-            pass
-        elif user.is_senior_council:
-            pass
-        elif user.is_junior_council:
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(domain=user.domain) | Q(assigned_by=user)
-                )
-            else:
-                # If no domain, show tasks they created or are assigned to them
-                queryset = queryset.filter(
-                    Q(assigned_by=user) | Q(assigned_to=user)
-                )
-        else:
-            if user.domain:
-                queryset = queryset.filter(
-                    Q(assigned_to=user) | 
-                    Q(domain=user.domain, assigned_to__isnull=True) |
-                    Q(assigned_by=user)
-                )
-            else:
-                # If no domain, show tasks assigned to them or tasks they created
-                queryset = queryset.filter(
-                    Q(assigned_to=user) | Q(assigned_by=user)
-                )
+        if self.request.method == 'GET':
+            # Load the detail payload in a constant number of queries:
+            # the task with its users, plus one query each for the latest
+            # comments and history entries.
+            limit = settings.TASK_DETAIL_EMBED_LIMIT
+            queryset = queryset.select_related('assigned_by', 'assigned_to').annotate(
+                history_total=_related_count(TaskHistory),
+            ).prefetch_related(
+                Prefetch(
+                    'comments',
+                    queryset=TaskComment.objects.select_related('author').order_by('-created_at')[:limit],
+                    to_attr='recent_comments'
+                ),
+                Prefetch(
+                    'history',
+                    queryset=TaskHistory.objects.select_related('user').order_by('-timestamp')[:limit],
+                    to_attr='recent_history'
+                ),
+            )
         
         return queryset
     
@@ -154,19 +308,36 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
 class TaskCommentView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = TaskCommentSerializer
+    pagination_class = TaskCommentPagination
+    
+    def get_task(self):
+        return generics.get_object_or_404(
+            get_visible_tasks(self.request.user), pk=self.kwargs.get('task_id')
+        )
     
     def get_queryset(self):
-        task_id = self.kwargs.get('task_id')
-        return TaskComment.objects.filter(task_id=task_id)
+        task = self.get_task()
+        return TaskComment.objects.filter(task=task).select_related('author')
     
     def perform_create(self, serializer):
-        task_id = self.kwargs.get('task_id')
         serializer.save(
-            task_id=task_id,
+            task=self.get_task(),
             author=self.request.user
         )
 
 
+class TaskHistoryView(generics.ListAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskHistorySerializer
+    pagination_class = TaskHistoryPagination
+    
+    def get_queryset(self):
+        task = generics.get_object_or_404(
+            get_visible_tasks(self.request.user), pk=self.kwargs.get('task_id')
+        )
+        return TaskHistory.objects.filter(task=task).select_related('user')
+
+
 class TaskCommentDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = TaskCommentSerializer
@@ -211,10 +382,7 @@ def task_statistics(request):
     pending_tasks = tasks.filter(status='pending').count()
     in_progress_tasks = tasks.filter(status='in_progress').count()
     completed_tasks = tasks.filter(status='completed').count()
-    overdue_tasks = tasks.filter(
-        due_date__lt=now,
-        status__in=['pending', 'in_progress']
-    ).count()
+    overdue_tasks = tasks.filter(overdue_q(now)).count()
     
     # Recent tasks (last 7 days)
     recent_tasks = tasks.filter(
@@ -252,8 +420,8 @@ def my_tasks(request):
     if status_filter:
         tasks = tasks.filter(status=status_filter)
     
-    serializer = TaskListSerializer(tasks, many=True)
-    return Response(serializer.data)
+    tasks = tasks.select_related('assigned_by', 'assigned_to')
+    return StreamingJSONResponse(serialize_queryset(tasks, TaskListSerializer))
 
 
 @api_view(['GET'])
@@ -289,8 +457,8 @@ def team_tasks(request):
     if status_filter:
         tasks = tasks.filter(status=status_filter)
     
-    serializer = TaskListSerializer(tasks, many=True)
-    return Response(serializer.data)
+    tasks = tasks.select_related('assigned_by', 'assigned_to')
+    return StreamingJSONResponse(serialize_queryset(tasks, TaskListSerializer))
 
 
 @api_view(['GET'])
@@ -345,4 +513,254 @@ def recent_tasks(request):
     ).order_by('-created_at')[:10]  # Limit to 10 most recent
     
     serializer = TaskListSerializer(recent_tasks, many=True)
-    return Response(serializer.data) 
\ No newline at end of file
+    return Response(serializer.data) 
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def due_soon_tasks(request):
+    """Group the caller's open tasks into overdue and upcoming deadline buckets"""
+    user = request.user
+    now = timezone.now()
+    today = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
+    tomorrow = today + timedelta(days=1)
+    day_after = today + timedelta(days=2)
+    week_end = now + timedelta(days=7)
+    
+    try:
+        limit = min(int(request.query_params.get('limit', 5)), 50)
+    except ValueError:
+        limit = 5
+    
+    tasks = get_visible_tasks(user).filter(status__in=Task.OPEN_STATUSES)
+    
+    # Bucket boundaries line up with the partial index on open tasks' due_date
+    buckets = {
+        'overdue': Q(due_date__lt=now),
+        'due_today': Q(due_date__gte=now, due_date__lt=tomorrow),
+        'due_tomorrow': Q(due_date__gte=tomorrow, due_date__lt=day_after),
+        'due_this_week': Q(due_date__gte=day_after, due_date__lt=week_end),
+    }
+    
+    counts = tasks.aggregate(**{
+        f'{name}_count': Count('pk', filter=condition) for name, condition in buckets.items()
+    })
+    
+    data = {}
+    for name, condition in buckets.items():
+        count = counts[f'{name}_count']
+        bucket_tasks = []
+        if count:
+            bucket_tasks = tasks.filter(condition).select_related(
+                'assigned_by', 'assigned_to'
+            ).order_by('due_date')[:limit]
+        data[name] = {
+            'count': count,
+            'tasks': TaskListSerializer(bucket_tasks, many=True).data,
+        }
+    
+    return Response(data)
+
+
+def _bulk_create_tasks(user, items):
+    """Validate every row up front, then insert tasks and history in batches"""
+    if not user.can_create_tasks():
+        return Response(
+            {'error': 'You do not have permission to create tasks.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    if user.is_junior_council and not user.domain:
+        return Response(
+            {'error': 'Junior Council members must have a domain to create tasks.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    serializer = TaskBulkCreateItemSerializer(data=items, many=True)
+    if not serializer.is_valid():
+        return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Resolve every assignee with a single query
+    assignee_ids = {row['assigned_to'] for row in serializer.validated_data if row.get('assigned_to')}
+    assignees = User.objects.in_bulk(assignee_ids)
+    missing = sorted(assignee_ids - set(assignees))
+    if missing:
+        return Response(
+            {'error': 'Unknown assignees.', 'missing_user_ids': missing},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    tasks = []
+    for row in serializer.validated_data:
+        row = dict(row)
+        assignee_id = row.pop('assigned_to', None)
+        if user.is_junior_council:
+            row['domain'] = user.domain
+        tasks.append(Task(assigned_by=user, assigned_to=assignees.get(assignee_id), **row))
+    
+    tasks = insert_tasks(tasks, user)
+    
+    return Response(
+        {'created': len(tasks), 'task_ids': [task.pk for task in tasks]},
+        status=status.HTTP_201_CREATED
+    )
+
+
+def _bulk_update_tasks(user, tasks, data):
+    """Apply a status change or reassignment with one bulk_update"""
+    now = timezone.now()
+    history = []
+    changed = []
+    
+    if data['action'] == 'update_status':
+        new_status = data['status']
+        fields = ['status', 'completed_at', 'updated_at']
+        for task in tasks:
+            if task.status == new_status:
+                continue
+            history.append(TaskHistory(
+                task=task, user=user, action='status_changed',
+                old_value=task.status, new_value=new_status
+            ))
+            task.status = new_status
+            task.completed_at = now if new_status == 'completed' else None
+            task.updated_at = now
+            changed.append(task)
+    else:
+        assignee_id = data['assigned_to']
+        if assignee_id is not None and not User.objects.filter(pk=assignee_id, is_active=True).exists():
+            return Response(
+                {'error': 'Unknown assignee.', 'missing_user_ids': [assignee_id]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        fields = ['assigned_to', 'updated_at']
+        for task in tasks:
+            if task.assigned_to_id == assignee_id:
+                continue
+            history.append(TaskHistory(
+                task=task, user=user, action='reassigned',
+                old_value=task.assigned_to_id, new_value=assignee_id
+            ))
+            task.assigned_to_id = assignee_id
+            task.updated_at = now
+            changed.append(task)
+    
+    with transaction.atomic():
+        Task.objects.bulk_update(changed, fields, batch_size=500)
+        TaskHistory.objects.bulk_create(history, batch_size=500)
+    invalidate_workload_cache()
+    
+    return Response({
+        'updated': len(changed),
+        'unchanged': len(tasks) - len(changed),
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_tasks(request):
+    """Create, update status, reassign or delete many tasks in one request"""
+    user = request.user
+    serializer = TaskBulkSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+    
+    if data['action'] == 'create':
+        return _bulk_create_tasks(user, data['tasks'])
+    
+    if data['action'] == 'delete':
+        if not user.can_delete_tasks():
+            return Response(
+                {'error': 'You do not have permission to delete tasks.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+    elif not user.can_edit_tasks():
+        return Response(
+            {'error': 'You do not have permission to edit tasks.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    # Check visibility for the whole batch in a single query
+    task_ids = data['task_ids']
+    tasks = list(
+        get_visible_tasks(user).filter(pk__in=task_ids).only(
+            'id', 'status', 'assigned_to', 'completed_at', 'updated_at'
+        )
+    )
+    missing = sorted(set(task_ids) - {task.pk for task in tasks})
+    if missing:
+        return Response(
+            {'error': 'Some tasks do not exist or are not visible to you.', 'missing_task_ids': missing},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    if data['action'] == 'delete':
+        with transaction.atomic():
+            Task.objects.filter(pk__in=task_ids).delete()
+        return Response({'deleted': len(task_ids)})
+    
+    return _bulk_update_tasks(user, tasks, data)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def import_tasks(request):
+    """Create tasks from an uploaded CSV file and report errors per row"""
+    user = request.user
+    
+    if not user.can_create_tasks():
+        return Response(
+            {'error': 'You do not have permission to create tasks.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    if user.is_junior_council and not user.domain:
+        return Response(
+            {'error': 'Junior Council members must have a domain to create tasks.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    if 'file' not in request.FILES:
+        return Response(
+            {'error': 'No CSV file provided'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    dry_run = str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes')
+    
+    try:
+        report = TaskImporter(user, dry_run=dry_run).run(request.FILES['file'])
+    except (UnicodeDecodeError, csv.Error) as e:
+        return Response(
+            {'error': f'Could not read CSV file: {e}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    report['dry_run'] = dry_run
+    response_status = status.HTTP_201_CREATED if report['created'] and not dry_run else status.HTTP_200_OK
+    return Response(report, status=response_status)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def task_workload(request):
+    """Open, overdue and due-this-week counts per board member of a domain"""
+    user = request.user
+    
+    if not user.can_create_tasks():
+        return Response(
+            {'error': 'You do not have permission to assign tasks.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    # Junior council can only look at their own domain
+    domain = user.domain if user.is_junior_council else request.query_params.get('domain')
+    if domain not in dict(User.DOMAIN_CHOICES):
+        return Response(
+            {'error': 'A valid domain is required.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    members = get_domain_workload(domain)
+    return Response({
+        'domain': domain,
+        'members': members,
+        'suggested_assignee': members[0] if members else None,
+    })
@@ -0,0 +1,58 @@
+"""
+Per-domain assignee workload, computed with one grouped query and cached
+until the next task write.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Task
+from .queries import overdue_q
+
+User = get_user_model()
+
+
+def workload_cache_key(domain):
+    return f'tasks:workload:{domain}'
+
+
+def invalidate_workload_cache():
+    """Drop every cached domain workload; called after any task write"""
+    cache.delete_many([workload_cache_key(code) for code, _ in User.DOMAIN_CHOICES])
+
+
+def compute_domain_workload(domain):
+    now = timezone.now()
+    open_tasks = Q(tasks_assigned__status__in=Task.OPEN_STATUSES)
+
+    members = User.objects.filter(
+        is_active=True,
+        role='board_member',
+        domain=domain
+    ).annotate(
+        open_tasks=Count('tasks_assigned', filter=open_tasks),
+        overdue_tasks=Count('tasks_assigned', filter=overdue_q(now, prefix='tasks_assigned__')),
+        due_this_week=Count('tasks_assigned', filter=open_tasks & Q(
+            tasks_assigned__due_date__gte=now,
+            tasks_assigned__due_date__lt=now + timedelta(days=7)
+        )),
+    ).values(
+        'id', 'username', 'first_name', 'last_name',
+        'open_tasks', 'overdue_tasks', 'due_this_week'
+    ).order_by('open_tasks', 'overdue_tasks', 'due_this_week', 'username')
+
+    return list(members)
+
+
+def get_domain_workload(domain):
+    """Board members of ``domain`` ordered from least to most loaded"""
+    key = workload_cache_key(domain)
+    members = cache.get(key)
+    if members is None:
+        members = compute_domain_workload(domain)
+        cache.set(key, members, settings.TASK_WORKLOAD_CACHE_TIMEOUT)
+    return members
@@ -151,6 +151,13 @@ export const usersAPI = {
   },
 };
 
+// Cursor-paginated list responses: follow `next` for older or newer pages
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
 // Tasks API
 export const tasksAPI = {
   getTasks: async (params?: any) => {
@@ -198,8 +205,9 @@ export const tasksAPI = {
     return response.data;
   },
   
-  getTaskComments: async (taskId: string) => {
-    const response = await api.get(`/tasks/${taskId}/comments/`);
+  // Pass a previous page's `next` URL as `pageUrl` to load the following page
+  getTaskComments: async (taskId: string, pageUrl?: string): Promise<CursorPage<any>> => {
+    const response = await api.get(pageUrl || `/tasks/${taskId}/comments/`);
     return response.data;
   },
   
@@ -216,6 +224,12 @@ export const notesAPI = {
     return response.data;
   },
   
+  // Follows the `next` cursor URL returned by getNotes
+  getNotesPage: async (url: string) => {
+    const response = await api.get(url);
+    return response.data;
+  },
+  
   getNote: async (id: string) => {
     const response = await api.get(`/notes/${id}/`);
     return response.data;
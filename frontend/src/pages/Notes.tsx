@@ -38,6 +38,8 @@ export default function Notes() {
   const { user } = useAuth();
   const [notes, setNotes] = useState<Note[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextPage, setNextPage] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [searchTerm, setSearchTerm] = useState('');
   const [showCreateDialog, setShowCreateDialog] = useState(false);
   const [createForm, setCreateForm] = useState({
@@ -68,26 +70,26 @@ export default function Notes() {
     fetchNotes();
   }, []);
 
+  // The list is cursor-paginated: each page has `results` and a `next` URL
+  const readNotesPage = (response: any): { notesData: Note[]; next: string | null } => {
+    if (response && typeof response === 'object') {
+      if (Array.isArray(response)) {
+        return { notesData: response, next: null };
+      } else if (response.results && Array.isArray(response.results)) {
+        return { notesData: response.results, next: response.next || null };
+      }
+    }
+    return { notesData: [], next: null };
+  };
+
   const fetchNotes = async () => {
     try {
       setLoading(true);
       const response = await notesAPI.getNotes();
-      
-      // Handle different response formats
-      let notesData;
-      if (response && typeof response === 'object') {
-        if (Array.isArray(response)) {
-          notesData = response;
-        } else if (response.results && Array.isArray(response.results)) {
-          notesData = response.results;
-        } else {
-          notesData = [];
-        }
-      } else {
-        notesData = [];
-      }
+      const { notesData, next } = readNotesPage(response);
       
       setNotes(notesData);
+      setNextPage(next);
     } catch (error) {
       console.error('Failed to fetch notes:', error);
       toast({
@@ -100,6 +102,27 @@ export default function Notes() {
     }
   };
 
+  const loadMoreNotes = async () => {
+    if (!nextPage) return;
+    try {
+      setLoadingMore(true);
+      const response = await notesAPI.getNotesPage(nextPage);
+      const { notesData, next } = readNotesPage(response);
+      
+      setNotes(prev => [...prev, ...notesData]);
+      setNextPage(next);
+    } catch (error) {
+      console.error('Failed to load more notes:', error);
+      toast({
+        title: "Error",
+        description: "Failed to load more notes. Please try again.",
+        variant: "destructive"
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleCreateNote = async () => {
     try {
       const noteData = {
@@ -427,6 +450,14 @@ export default function Notes() {
             </CardContent>
           </Card>
         )}
+        
+        {nextPage && (
+          <div className="flex justify-center">
+            <Button variant="outline" onClick={loadMoreNotes} disabled={loadingMore}>
+              {loadingMore ? 'Loading...' : 'Load more notes'}
+            </Button>
+          </div>
+        )}
       </div>
 
       {/* Stats */}